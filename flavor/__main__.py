@@ -0,0 +1,16 @@
+# flavor/__main__.py
+import os
+
+def main():
+    # Completing project/user IDs is answered from a local index without
+    # importing the full CLI (typer, rich, requests), so TAB stays instant
+    if os.environ.get("_FLAVOR_COMPLETE"):
+        from flavor.completion import complete_fast
+        if complete_fast():
+            return
+
+    from flavor.cli import main as cli_main
+    cli_main()
+
+if __name__ == "__main__":
+    main()
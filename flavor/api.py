@@ -1,11 +1,85 @@
+import copy
+import functools
+import inspect
+import threading
+import time
 import requests
-from flavor.config import get_api_key
+from flavor.completion import remembered
+from flavor.config import get_api_key, get_flavor_id, get_active_profile
+from flavor import http
+from flavor.ledger import record_balance, LedgerError
+from flavor.store import cached, is_offline
 
 API_BASE_URL = "https://flavortown.hackclub.com"
 
+# How long a finished GET is reused within the same process
+MEMO_TTL_SECONDS = 30
+
 class APIError(Exception):
     pass
 
+class _Flight:
+    """A GET that is currently being fetched, shared by every caller asking for it."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+_flight_lock = threading.Lock()
+_in_flight = {}
+_memo = {}
+
+def _coalesced(func):
+    """
+    Single-flight wrapper for read-only API calls.
+
+    Concurrent calls with the same arguments share one request, and a finished
+    result is memoized for MEMO_TTL_SECONDS so a command that needs the same
+    resource twice only fetches it once. Callers always get their own copy.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (get_active_profile(), func.__name__, tuple(bound.arguments.items()))
+
+        with _flight_lock:
+            memo = _memo.get(key)
+            if memo is not None and time.monotonic() - memo[0] < MEMO_TTL_SECONDS:
+                return copy.deepcopy(memo[1])
+            flight = _in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _in_flight[key] = _Flight()
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = func(*args, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with _flight_lock:
+                del _in_flight[key]
+                if flight.error is None:
+                    _memo[key] = (time.monotonic(), flight.result)
+            flight.done.set()
+        return copy.deepcopy(flight.result)
+
+    return wrapper
+
+def _invalidate_memo():
+    """Forget memoized GETs, called after anything that changes server state."""
+    with _flight_lock:
+        _memo.clear()
+
 def _get_headers():
     key = get_api_key()
     if not key:
@@ -19,13 +93,16 @@ def _get_headers():
 
     return headers
 
+@remembered
+@_coalesced
+@cached(APIError)
 def get_users(page: int = 1, query: str = None):
     url = f"{API_BASE_URL}/api/v1/users"
     params = {"page": page}
     if query:
         params["query"] = query
     try:
-        response = requests.get(url, headers=_get_headers(), params=params)
+        response = http.get(url, headers=_get_headers(), params=params)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -33,10 +110,23 @@ def get_users(page: int = 1, query: str = None):
              raise APIError("Invalid API key or unauthorized access.")
         raise APIError(f"Failed to fetch users: {str(e)}")
 
+def _record_balance(user: dict, user_id: int):
+    """Add every live balance to the cookie ledger for 'cookies history'."""
+    if not isinstance(user, dict) or user.get("cookies") is None:
+        return
+    try:
+        record_balance(int(user_id), int(user["cookies"]))
+    except (LedgerError, OSError, ValueError):
+        # History is best effort, never break the actual command
+        pass
+
+@remembered
+@_coalesced
+@cached(APIError, on_fetched=_record_balance)
 def get_user_by_id(user_id: int):
     url = f"{API_BASE_URL}/api/v1/users/{user_id}"
     try:
-        response = requests.get(url, headers=_get_headers())
+        response = http.get(url, headers=_get_headers())
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -44,10 +134,13 @@ def get_user_by_id(user_id: int):
              raise APIError(f"User with ID {user_id} not found.")
         raise APIError(f"Failed to fetch user: {str(e)}")
     
+@remembered
+@_coalesced
+@cached(APIError)
 def get_shop():
     url = f"{API_BASE_URL}/api/v1/store"
     try:
-        response = requests.get(url, headers=_get_headers())
+        response = http.get(url, headers=_get_headers())
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -55,13 +148,16 @@ def get_shop():
             raise APIError("Invalid API key or unauthorized access.")
         raise APIError(f"Failed to fetch shop items: {str(e)}")
 
+@remembered
+@_coalesced
+@cached(APIError)
 def get_projects(page: int = 1, query: str = None):
     url = f"{API_BASE_URL}/api/v1/projects"
     params = {"page": page}
     if query:
         params["query"] = query
     try:
-        response = requests.get(url, headers=_get_headers(), params=params)
+        response = http.get(url, headers=_get_headers(), params=params)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -69,10 +165,13 @@ def get_projects(page: int = 1, query: str = None):
              raise APIError("Invalid API key or unauthorized access.")
         raise APIError(f"Failed to fetch projects: {str(e)}")
 
+@remembered
+@_coalesced
+@cached(APIError)
 def get_project(project_id: int):
     url = f"{API_BASE_URL}/api/v1/projects/{project_id}"
     try:
-        response = requests.get(url, headers=_get_headers())
+        response = http.get(url, headers=_get_headers())
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -80,7 +179,15 @@ def get_project(project_id: int):
              raise APIError(f"Project with ID {project_id} not found.")
         raise APIError(f"Failed to fetch project: {str(e)}")
 
+def _forget_own_profile():
+    # Our own user record lists project IDs, so it's stale after a change
+    flavor_id = get_flavor_id()
+    if flavor_id and str(flavor_id).isdigit():
+        get_user_by_id.forget(int(flavor_id))
+
 def create_project(title: str, description: str, repo_url: str = None, demo_url: str = None, readme_url: str = None):
+    if is_offline():
+        raise APIError("Cannot create a project in offline mode.")
     url = f"{API_BASE_URL}/api/v1/projects"
     project_data = {
         "title": title,
@@ -96,8 +203,10 @@ def create_project(title: str, description: str, repo_url: str = None, demo_url:
     body = {"project": project_data}
     
     try:
-        response = requests.post(url, headers=_get_headers(), json=body)
+        response = http.post(url, headers=_get_headers(), json=body)
         response.raise_for_status()
+        _invalidate_memo()
+        _forget_own_profile()
         return response.json()
     except requests.RequestException as e:
         if isinstance(e, requests.HTTPError) and e.response.status_code == 401:
@@ -109,6 +218,8 @@ def create_project(title: str, description: str, repo_url: str = None, demo_url:
         raise APIError(f"Failed to create project: {str(e)}")
 
 def update_project(project_id: int, title: str = None, description: str = None, repo_url: str = None, demo_url: str = None, readme_url: str = None):
+    if is_offline():
+        raise APIError("Cannot update a project in offline mode.")
     url = f"{API_BASE_URL}/api/v1/projects/{project_id}"
     project_data = {}
     if title is not None:
@@ -125,8 +236,11 @@ def update_project(project_id: int, title: str = None, description: str = None,
     body = {"project": project_data}
     
     try:
-        response = requests.patch(url, headers=_get_headers(), json=body)
+        response = http.patch(url, headers=_get_headers(), json=body)
         response.raise_for_status()
+        _invalidate_memo()
+        _forget_own_profile()
+        get_project.forget(project_id)
         return response.json()
     except requests.RequestException as e:
         if isinstance(e, requests.HTTPError) and e.response.status_code == 401:
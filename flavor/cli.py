@@ -1,9 +1,19 @@
 import typer
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from pathlib import Path
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
-from flavor.config import set_flavor_id, get_flavor_id, set_hackatime_username, get_hackatime_username
+from flavor.config import (
+    set_flavor_id, get_flavor_id, set_hackatime_username, get_hackatime_username,
+    set_active_profile, list_profiles, use_profile,
+)
 from flavor.api import get_user_by_id, APIError
 from flavor.hackatime import get_stats, HackatimeAPIError
+from flavor.http import set_deadline, restart_deadline, DEFAULT_DEADLINE_SECONDS
+from flavor.store import set_offline, set_refresh, print_staleness
+from flavor import profiling
 
 # Command modules
 from flavor.commands.cookies import app as cookies_app
@@ -12,6 +22,8 @@ from flavor.commands.times import app as time_app
 from flavor.commands.login import app as login_app
 from flavor.commands.search import app as search_app
 from flavor.commands.projects import app as projects_app
+from flavor.commands.cache import app as cache_app
+from flavor.commands.shop import app as shop_app
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -21,24 +33,269 @@ app.add_typer(time_app, name="time", help="Track your coding time with Hackatime
 app.add_typer(login_app, name="login", help="Manage your login credentials.")
 app.add_typer(search_app, name="search", help="Search for resources.")
 app.add_typer(projects_app, name="projects", help="Create and manage your projects.")
+app.add_typer(shop_app, name="shop", help="Plan what to buy from the shop.")
+app.add_typer(cache_app, name="cache", help="Inspect and trim the local response store.")
 
 console = Console()
 
 @app.callback()
-def callback():
+def callback(
+    ctx: typer.Context,
+    profile: str = typer.Option(None, "--profile", "-p", help="Use the credentials of a named profile."),
+    offline: bool = typer.Option(False, "--offline", help="Only use cached responses, never touch the network."),
+    refresh: bool = typer.Option(False, "--refresh", help="Always fetch fresh data instead of showing cached data first."),
+    timeout: float = typer.Option(DEFAULT_DEADLINE_SECONDS, "--timeout", min=1, help="Seconds the whole command may spend waiting on the network."),
+    profiler: str = typer.Option(None, "--profiler", help="Profile the command's CPU time (cpu) or allocations (mem)."),
+    profiler_top: int = typer.Option(15, "--profiler-top", min=1, help="How many functions or allocation sites --profiler prints."),
+):
     """
     FlavorLineTool - A CLI for tracking cookies and interacting with Flavortown.
     """
-    pass
-    
+    set_active_profile(profile)
+    set_offline(offline)
+    set_refresh(refresh)
+    set_deadline(timeout)
+
+    if profiler:
+        if profiler not in profiling.MODES:
+            raise typer.BadParameter(f"Profile one of: {', '.join(profiling.MODES)}.", param_hint="--profiler")
+        # Stops once the command has finished, even if it failed
+        ctx.call_on_close(profiling.start(profiler, ctx.invoked_subcommand or "flavor", profiler_top))
+
 @app.command()
 def status():
     """Check FLT's status (if for some reason you feel you have to)."""
     console.print("FlavorLineTool is alive, I think!!!", style="blink green")
 
+def _stats_row(ft_data: dict, ht_data: dict) -> tuple:
+    """Pick the displayed fields out of a Flavortown user and Hackatime stats response."""
+    display_name = ft_data.get("display_name") or "Unknown"
+    cookies = ft_data.get("cookies")
+    if cookies is None:
+        cookies = 0
+
+    ht_data_content = ht_data.get("data", {})
+    time_str = ht_data_content.get("human_readable_total", "0 secs")
+    
+    languages = ht_data_content.get("languages", [])
+    top_lang = "N/A"
+    top_lang_time = "N/A"
+    
+    if languages:
+        first_lang = languages[0]
+        top_lang = first_lang.get("name", "Unknown")
+        top_lang_time = first_lang.get("text", "0 secs")
+
+    return display_name, time_str, str(cookies), top_lang, top_lang_time
+
+def _in_profile(profile: str, func, *args):
+    with use_profile(profile):
+        return func(*args)
+
+def _all_profiles_stats():
+    """Fetch every profile's Flavortown and Hackatime stats at once and show them together."""
+    requests_by_profile = {}
+    for profile in list_profiles():
+        with use_profile(profile):
+            requests_by_profile[profile] = (get_flavor_id(), get_hackatime_username())
+
+    # Profiles without any credentials (e.g. an unused default) are skipped
+    requests_by_profile = {p: ids for p, ids in requests_by_profile.items() if any(ids)}
+    if not requests_by_profile:
+        console.print("No profiles have a Flavor ID or Hackatime username set.", style="yellow")
+        return
+
+    rows = []
+    errors = []
+    with console.status(f"Fetching stats for {len(requests_by_profile)} profiles...", spinner="dots"):
+        with ThreadPoolExecutor(max_workers=min(8, 2 * len(requests_by_profile))) as pool:
+            futures = {}
+            for profile, (flavor_id, ht_username) in requests_by_profile.items():
+                ft_future = ht_future = None
+                if flavor_id and str(flavor_id).isdigit():
+                    ft_future = pool.submit(_in_profile, profile, get_user_by_id, int(flavor_id))
+                elif flavor_id:
+                    errors.append(f"{profile}: stored Flavor ID is not a valid integer.")
+                if ht_username:
+                    ht_future = pool.submit(_in_profile, profile, get_stats, ht_username)
+                futures[profile] = (ft_future, ht_future)
+
+            for profile, (ft_future, ht_future) in futures.items():
+                ft_data, ht_data = {}, {}
+                try:
+                    if ft_future is not None:
+                        ft_data = ft_future.result()
+                except APIError as e:
+                    errors.append(f"{profile}: API Error: {e}")
+                try:
+                    if ht_future is not None:
+                        ht_data = ht_future.result()
+                except HackatimeAPIError as e:
+                    errors.append(f"{profile}: Hackatime Error: {e}")
+                rows.append((profile,) + _stats_row(ft_data, ht_data))
+
+    table = Table(title="Stats for All Profiles")
+    table.add_column("Profile", style="cyan")
+    table.add_column("Display Name", style="magenta")
+    table.add_column("Total Time Coded", style="cyan")
+    table.add_column("Cookies", justify="right", style="yellow")
+    table.add_column("Top Language", style="blue")
+    table.add_column("Time in Top Language", style="green")
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+    for error in errors:
+        console.print(error, style="bold red")
+
+    print_staleness(console)
+
+def _parse_people(users: str, users_file: Path) -> list:
+    """
+    Parse team members given as "FLAVOR_ID:HACKATIME_USERNAME" entries.
+    Either half may be left out ("12", ":alice"). Inline entries are comma
+    separated; a file has one entry per line (whitespace also works as the
+    separator there) and may contain # comments.
+    """
+    entries = []
+    if users:
+        entries.extend(e.strip() for e in users.split(","))
+    if users_file:
+        try:
+            lines = users_file.read_text().splitlines()
+        except OSError as e:
+            raise typer.BadParameter(f"Could not read {users_file}: {e}")
+        for line in lines:
+            line = line.split("#", 1)[0].strip()
+            if line and ":" not in line:
+                line = ":".join(line.split(None, 1)) if len(line.split()) > 1 else line
+            entries.append(line)
+
+    people = []
+    for entry in entries:
+        if not entry:
+            continue
+        flavor_id, _, ht_username = entry.partition(":")
+        flavor_id, ht_username = flavor_id.strip(), ht_username.strip()
+        if not flavor_id and not ht_username:
+            raise typer.BadParameter(f"'{entry}' has neither a Flavortown user ID nor a Hackatime username.")
+        if flavor_id and not flavor_id.isdigit():
+            raise typer.BadParameter(f"'{flavor_id}' is not a valid Flavortown user ID.")
+        people.append((int(flavor_id) if flavor_id else None, ht_username or None))
+    return people
+
+_TEAM_SORT_KEYS = {
+    "cookies": (lambda r: r["cookies"], True),
+    "time": (lambda r: r["seconds"], True),
+    "name": (lambda r: r["name"].lower(), False),
+    "language": (lambda r: r["top_lang"].lower(), False),
+}
+
+def _team_table(rows: list, sort: str, total: int) -> Table:
+    key, reverse = _TEAM_SORT_KEYS[sort]
+    # People whose requests failed go last, in the order they finished
+    failed = [row for row in rows if row["failed"]]
+    rows = sorted((row for row in rows if not row["failed"]), key=key, reverse=reverse) + failed
+
+    table = Table(title=f"Team Stats ({len(rows)}/{total})")
+    table.add_column("Flavor ID", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Display Name", style="magenta")
+    table.add_column("Hackatime User", style="green")
+    table.add_column("Total Time Coded", style="cyan")
+    table.add_column("Cookies", justify="right", style="yellow")
+    table.add_column("Top Language", style="blue")
+    error = "[red]error[/red]"
+    for row in rows:
+        ft_failed, ht_failed = "ft" in row["failed"], "ht" in row["failed"]
+        table.add_row(
+            str(row["flavor_id"] or "-"), error if ft_failed else row["name"], row["ht_username"] or "-",
+            error if ht_failed else row["time"], error if ft_failed else str(row["cookies"]),
+            error if ht_failed else row["top_lang"],
+        )
+    return table
+
+def _team_stats(people: list, sort: str, workers: int):
+    """
+    Fetch stats for many people through a bounded thread pool, adding each
+    person to the (sorted) table as soon as both of their requests finish.
+    """
+    rows = []
+    errors = []
+    pending = {}
+    futures = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, (flavor_id, ht_username) in enumerate(people):
+            pending[index] = {}
+            if flavor_id is not None:
+                futures[pool.submit(get_user_by_id, flavor_id)] = (index, "ft")
+            if ht_username:
+                futures[pool.submit(get_stats, ht_username)] = (index, "ht")
+
+        # Stream rows into a live table on a terminal, print it once otherwise
+        live = Live(_team_table(rows, sort, len(people)), console=console, auto_refresh=False)
+        with live if console.is_terminal else nullcontext():
+            for future in as_completed(futures):
+                index, source = futures[future]
+                flavor_id, ht_username = people[index]
+                try:
+                    pending[index][source] = future.result()
+                except (APIError, HackatimeAPIError) as e:
+                    who = flavor_id if source == "ft" else ht_username
+                    errors.append(f"{who}: {e}")
+                    pending[index][source] = None
+
+                expected = (flavor_id is not None) + bool(ht_username)
+                if len(pending[index]) < expected:
+                    continue
+
+                results = pending.pop(index)
+                ft_data, ht_data = results.get("ft") or {}, results.get("ht") or {}
+                name, time_str, cookies, top_lang, _ = _stats_row(ft_data, ht_data)
+                rows.append({
+                    "flavor_id": flavor_id,
+                    "ht_username": ht_username,
+                    "name": name,
+                    "time": time_str,
+                    "seconds": ht_data.get("data", {}).get("total_seconds") or 0,
+                    "cookies": int(cookies),
+                    "top_lang": top_lang,
+                    "failed": [source for source, data in results.items() if data is None],
+                })
+                if console.is_terminal:
+                    live.update(_team_table(rows, sort, len(people)), refresh=True)
+
+    if not console.is_terminal:
+        console.print(_team_table(rows, sort, len(people)))
+
+    for error in errors:
+        console.print(error, style="bold red")
+
+    print_staleness(console)
+
 @app.command()
-def stats():
+def stats(
+    all_profiles: bool = typer.Option(False, "--all-profiles", help="Show stats for every configured profile."),
+    users: str = typer.Option(None, "--users", "-u", help="Comma separated FLAVOR_ID:HACKATIME_USER entries to report on."),
+    users_file: Path = typer.Option(None, "--users-file", "-f", help="File with one FLAVOR_ID:HACKATIME_USER entry per line."),
+    sort: str = typer.Option("cookies", "--sort", "-s", help="Sort team rows by cookies, time, name or language."),
+    workers: int = typer.Option(8, "--workers", min=1, max=32, help="How many requests to run at once for --users."),
+):
     """Show all your stats (Flavortown + Hackatime)."""
+    if all_profiles:
+        _all_profiles_stats()
+        return
+
+    if users or users_file:
+        if sort not in _TEAM_SORT_KEYS:
+            raise typer.BadParameter(f"Sort by one of: {', '.join(_TEAM_SORT_KEYS)}.", param_hint="--sort")
+        people = _parse_people(users, users_file)
+        if not people:
+            console.print("No users given.", style="yellow")
+            return
+        _team_stats(people, sort, workers)
+        return
+
     flavor_id = get_flavor_id()
     if not flavor_id:
         console.print("You are not logged in with your Flavor ID.", style="yellow")
@@ -58,27 +315,11 @@ def stats():
             ht_username = typer.prompt("Please enter your Hackatime username")
             set_hackatime_username(ht_username)
             console.print(f"Hackatime username saved!", style="green")
+            restart_deadline()
 
         with console.status("Fetching Hackatime stats...", spinner="dots"):
            ht_data = get_stats(ht_username)
 
-        display_name = ft_data.get("display_name") or "Unknown"
-        cookies = ft_data.get("cookies")
-        if cookies is None:
-            cookies = 0
-
-        ht_data_content = ht_data.get("data", {})
-        time_str = ht_data_content.get("human_readable_total", "0 secs")
-        
-        languages = ht_data_content.get("languages", [])
-        top_lang = "N/A"
-        top_lang_time = "N/A"
-        
-        if languages:
-            first_lang = languages[0]
-            top_lang = first_lang.get("name", "Unknown")
-            top_lang_time = first_lang.get("text", "0 secs")
-
         table = Table(title="Your Stats")
         table.add_column("Display Name", style="magenta")
         table.add_column("Total Time Coded", style="cyan")
@@ -86,10 +327,12 @@ def stats():
         table.add_column("Top Language", style="blue")
         table.add_column("Time in Top Language", style="green")
         
-        table.add_row(display_name, time_str, str(cookies), top_lang, top_lang_time)
+        table.add_row(*_stats_row(ft_data, ht_data))
         
         console.print(table)
 
+        print_staleness(console)
+
     except APIError as e:
         console.print(f"API Error: {e}", style="bold red")
     except HackatimeAPIError as e:
@@ -0,0 +1,76 @@
+import time
+import typer
+from datetime import datetime
+from rich.console import Console
+from rich.table import Table
+from flavor.store import stats as store_stats, prune as store_prune, format_age, StoreError, STORE_FILE
+
+app = typer.Typer(no_args_is_help=True)
+console = Console()
+
+def _size(num_bytes: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+def _ago(timestamp: float) -> str:
+    return f"{format_age(time.time() - timestamp)} ago" if timestamp else "-"
+
+@app.command("stats")
+def stats():
+    """Show what the local response store holds and how much space it saves."""
+    try:
+        info = store_stats()
+    except StoreError as e:
+        console.print(str(e), style="bold red")
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold]Store:[/bold] {STORE_FILE} ({_size(info['file_size'])} on disk)")
+    console.print(
+        f"[bold]Entries:[/bold] {info['entries']} pointing to {info['objects']} unique payloads"
+        f" (oldest {_ago(info['oldest'])}, newest {_ago(info['newest'])})"
+    )
+    saved = info["logical_size"] - info["stored_size"]
+    ratio = info["logical_size"] / info["stored_size"] if info["stored_size"] else 1
+    console.print(
+        f"[bold]Payloads:[/bold] {_size(info['logical_size'])} as JSON, {_size(info['raw_size'])} after"
+        f" deduplication, {_size(info['stored_size'])} {info['codec']}-compressed"
+        f" ([green]{_size(max(saved, 0))} saved, {ratio:.1f}x[/green])"
+    )
+
+    if not info["endpoints"]:
+        return
+
+    table = Table(title="Entries by endpoint")
+    table.add_column("Endpoint", style="cyan")
+    table.add_column("Entries", justify="right")
+    table.add_column("Unique", justify="right")
+    table.add_column("Last stored", style="dim")
+    for endpoint, entries, unique, newest in info["endpoints"]:
+        table.add_row(
+            endpoint, str(entries), str(unique),
+            datetime.fromtimestamp(newest).strftime("%Y-%m-%d %H:%M"),
+        )
+    console.print(table)
+
+@app.command("prune")
+def prune(
+    older_than: int = typer.Option(30, "--older-than", min=0, help="Remove entries stored more than this many days ago."),
+    endpoint: str = typer.Option(None, "--endpoint", "-e", help="Only remove entries whose endpoint contains this text."),
+    all: bool = typer.Option(False, "--all", help="Remove every entry, regardless of age."),
+):
+    """Remove old entries from the local response store and reclaim the space."""
+    try:
+        before = store_stats()["file_size"]
+        entries, objects = store_prune(None if all else older_than * 86400, endpoint)
+        after = store_stats()["file_size"]
+    except StoreError as e:
+        console.print(str(e), style="bold red")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"Removed {entries} entries and {objects} payloads, freed {_size(max(before - after, 0))}.",
+        style="green",
+    )
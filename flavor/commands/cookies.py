@@ -1,7 +1,11 @@
 import typer
+from datetime import date, timedelta
 from rich.console import Console
+from rich.table import Table
 from flavor.config import get_flavor_id
 from flavor.api import get_user_by_id, APIError
+from flavor.ledger import history as ledger_history, LedgerError
+from flavor.store import is_offline, set_refresh, print_staleness
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
@@ -14,6 +18,11 @@ def show():
         console.print("You must login with your Flavor ID first using 'flavor loginid <id>'", style="bold red")
         raise typer.Exit(code=1)
     
+    # The balance is what this command is for, so don't show a cached one
+    # (it's still used as a fallback when the API can't be reached)
+    if not is_offline():
+        set_refresh(True)
+
     try:
         with console.status("Fetching your cookies from API...", spinner="dots"):
             data = get_user_by_id(int(flavor_id))
@@ -24,8 +33,83 @@ def show():
             cookie_count = 0
             
         console.print(f"You ({name}) have [bold yellow]{cookie_count}[/bold yellow] cookies.", style="green")
+
+        print_staleness(console)
         
     except APIError as e:
         console.print(f"Error: {e}", style="bold red")
     except ValueError:
         console.print("Stored Flavor ID is not a valid integer.", style="bold red")
+
+def _signed(value) -> str:
+    if value is None:
+        return "-"
+    if value > 0:
+        return f"[green]+{value}[/green]"
+    if value < 0:
+        return f"[red]{value}[/red]"
+    return "[dim]0[/dim]"
+
+@app.command("history")
+def history(
+    days: int = typer.Option(14, "--days", "-d", min=1, help="How many days to show."),
+    target: int = typer.Option(None, "--target", "-t", help="Estimate when you'll reach this many cookies."),
+):
+    """Show how your cookie balance changed over time (recorded whenever your balance is fetched)."""
+    flavor_id = get_flavor_id()
+    if not flavor_id:
+        console.print("You must login with your Flavor ID first using 'flavor loginid <id>'", style="bold red")
+        raise typer.Exit(code=1)
+
+    try:
+        summary = ledger_history(int(flavor_id), days=days)
+    except LedgerError as e:
+        console.print(f"Error: {e}", style="bold red")
+        raise typer.Exit(code=1)
+    except ValueError:
+        console.print("Stored Flavor ID is not a valid integer.", style="bold red")
+        raise typer.Exit(code=1)
+
+    if summary is None:
+        console.print("No cookie history yet. Run 'flavor cookies show' to record your balance.", style="yellow")
+        return
+
+    table = Table(title=f"Cookie History (last {days} days)")
+    table.add_column("Date", style="cyan")
+    table.add_column("Balance", justify="right", style="yellow")
+    table.add_column("Change", justify="right")
+    table.add_column("Earned", justify="right", style="green")
+
+    for day in summary["daily"]:
+        balance = str(day["balance"]) if day["balance"] is not None else "-"
+        earned = str(day["earned"]) if day["earned"] else "-"
+        table.add_row(day["day"].isoformat(), balance, _signed(day["change"]), earned)
+
+    console.print(table)
+
+    first_seen = date.fromtimestamp(summary["first_seen"]).isoformat()
+    console.print(f"Tracking since [cyan]{first_seen}[/cyan] • {summary['window_samples']} samples in this period")
+    console.print(f"All-time change: {_signed(summary['all_time_change'])}", end="")
+    if summary["all_time_rate"] is not None:
+        console.print(f" ([bold]{summary['all_time_rate']:.1f}[/bold]/day)")
+    else:
+        console.print()
+
+    rate = summary["window_rate"]
+    balance = summary["balance"]
+    console.print(f"Earning rate: [bold green]{rate:.1f}[/bold green] cookies/day over the last {days} days")
+
+    if rate > 0:
+        console.print(
+            f"Projection: ~[yellow]{balance + rate * 7:.0f}[/yellow] in a week, "
+            f"~[yellow]{balance + rate * 30:.0f}[/yellow] in a month"
+        )
+    if target is not None:
+        if balance >= target:
+            console.print(f"You already have {target} cookies!", style="green")
+        elif rate > 0:
+            days_left = (target - balance) / rate
+            eta = date.today() + timedelta(days=round(days_left))
+            console.print(f"At this rate you'll reach [bold]{target}[/bold] cookies in about {days_left:.0f} days ({eta.isoformat()}).")
+        else:
+            console.print(f"You haven't earned cookies recently, so there is no estimate for {target} cookies.", style="yellow")
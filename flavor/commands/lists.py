@@ -1,14 +1,31 @@
 import typer
 from rich.console import Console
-from rich.table import Table
 from flavor.config import get_flavor_id, set_flavor_id
 from flavor.api import get_shop, get_users, get_user_by_id, get_project, APIError
+from flavor.pager import Pager
+from flavor.prefetch import prefetch_in_background
+from flavor.store import print_staleness
+from flavor.tables import USER_COLUMNS, PROJECT_COLUMNS, SHOP_COLUMNS, make_table, user_row, project_row, shop_row
+from flavor.tui import is_interactive
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
+def _users_page_fetcher(query: str = None):
+    """Adapt get_users to the Pager's fetch_page interface."""
+    def fetch_page(page: int):
+        data = get_users(page=page, query=query)
+        pagination = data.get("pagination", {})
+        return data.get("users", []), pagination.get("total_pages"), pagination.get("total_count")
+    return fetch_page
+
+def _check_pager():
+    if not is_interactive():
+        console.print("The pager needs a terminal.", style="bold red")
+        raise typer.Exit(code=1)
+
 @app.command("shop")
-def shop():
+def shop(pager: bool = typer.Option(False, "--pager", help="Browse the items in a scrollable view.")):
     """List all items in the shop."""
     try:
         with console.status("Fetching shop items...", spinner="dots"):
@@ -20,32 +37,43 @@ def shop():
 
         items.sort(key=lambda x: x.get("id", 0))
 
-        table = Table(title="Flavortown Shop")
-        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Name", style="magenta")
-        table.add_column("Cost", justify="right", style="green")
-        table.add_column("Stock", justify="right", style="yellow")
-        table.add_column("Limited", justify="center", style="red")
+        if pager:
+            _check_pager()
+            # The store endpoint isn't paginated, the pager still only lays out what's visible
+            Pager("Flavortown Shop", SHOP_COLUMNS, lambda page: (items if page == 1 else [], 1, len(items)), shop_row, console).run()
+            return
 
+        table = make_table("Flavortown Shop", SHOP_COLUMNS)
         for item in items:
-            i_id = str(item.get("id"))
-            name = item.get("name") or "Unknown"
-            
-            ticket_cost = item.get("ticket_cost", {})
-            cost = str(ticket_cost.get("base_cost") if ticket_cost else "N/A")
-
-            stock = str(item.get("stock")) if item.get("stock") is not None else "∞"
-            
-            is_limited = "Yes" if item.get("limited") else "No"
-            table.add_row(i_id, name, cost, stock, is_limited)
+            table.add_row(*shop_row(item))
         
         console.print(table)
+
+        print_staleness(console)
     except APIError as e:
         console.print(f"Error: {e}", style="bold red")
 
 @app.command("users")
-def users(page: int = 1):
+def users(
+    page: int = 1,
+    pager: bool = typer.Option(False, "--pager", help="Scroll through all users, loading pages as needed."),
+    prefetch: bool = typer.Option(False, "--prefetch", envvar="FLAVOR_PREFETCH", help="Fetch the next page in the background so it shows up instantly."),
+):
     """List users (paginated)."""
+    if pager:
+        _check_pager()
+        try:
+            view = Pager("Flavortown Users", USER_COLUMNS, _users_page_fetcher(), user_row, console)
+            with console.status(f"Fetching users (page {page})...", spinner="dots"):
+                view.load(start_page=page)
+            if not any(view.pages.values()):
+                console.print("No users found on this page.", style="yellow")
+                return
+            view.run()
+        except APIError as e:
+            console.print(f"Error: {e}", style="bold red")
+        return
+
     try:
         with console.status(f"Fetching users (page {page})...", spinner="dots"):
             data = get_users(page)
@@ -61,19 +89,9 @@ def users(page: int = 1):
         current_page = pagination.get("current_page", page)
         total_pages = pagination.get("total_pages", "Unknown")
         
-        title = "Flavortown Users"
-        table = Table(title=title)
-        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Display Name", style="magenta")
-        table.add_column("Slack ID", style="green")
-        table.add_column("Cookies", justify="right", style="yellow")
-
+        table = make_table("Flavortown Users", USER_COLUMNS)
         for user in users_list:
-            d_name = user.get("display_name") or "Unknown"
-            s_id = user.get("slack_id") or "N/A"
-            c_count = str(user.get("cookies") if user.get("cookies") is not None else 0)
-            
-            table.add_row(str(user.get("id")), d_name, s_id, c_count)
+            table.add_row(*user_row(user))
         
         console.print(table)
         
@@ -86,6 +104,10 @@ def users(page: int = 1):
         
         console.print(footer_info, justify="center")
         console.print(f"[dim]Tip: Use 'flavor list users --page {page + 1}' to see the next page.[/dim]", justify="center")
+        if prefetch and not (isinstance(total_pages, int) and current_page >= total_pages):
+            prefetch_in_background("users", page=page + 1)
+
+        print_staleness(console)
 
     except APIError as e:
         console.print(f"Error: {e}", style="bold red")
@@ -124,24 +146,14 @@ def my_projects():
             console.print("No project details could be retrieved.", style="red")
             return
 
-        table = Table(title="Your Projects")
-        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Title", style="magenta")
-        table.add_column("Description", style="white")
-        table.add_column("Repo URL", style="blue")
-        
+        table = make_table("Your Projects", PROJECT_COLUMNS)
         for project in projects:
-            p_id = str(project.get("id"))
-            title = project.get("title") or "Unknown"
-            desc = project.get("description") or "-"
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
-            repo = project.get("repo_url") or "-"
-            
-            table.add_row(p_id, title, desc, repo)
+            table.add_row(*project_row(project))
             
         console.print(table)
 
+        print_staleness(console)
+
     except APIError as e:
         console.print(f"Error: {e}", style="bold red")
     except ValueError:
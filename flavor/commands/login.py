@@ -1,6 +1,12 @@
 import typer
 from rich.console import Console
-from flavor.config import set_api_key, set_flavor_id, set_hackatime_key, set_hackatime_username
+from rich.table import Table
+from flavor.completion import autocomplete_user_ids, autocomplete_usernames
+from flavor.config import (
+    set_api_key, set_flavor_id, set_hackatime_key, set_hackatime_username,
+    get_api_key, get_flavor_id, get_hackatime_key, get_hackatime_username,
+    get_active_profile, list_profiles, use_profile,
+)
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
@@ -19,7 +25,7 @@ def api(key: str = typer.Argument(None, help="Your Flavortown API key")):
     console.print(f"Successfully logged in with to Flavortown API!", style="green")
 
 @app.command("id")
-def id(key: str = typer.Argument(None, help="Your Flavortown User ID")):
+def id(key: str = typer.Argument(None, help="Your Flavortown User ID", autocompletion=autocomplete_user_ids)):
     """Login with your Flavortown UserID."""
     if key is None:
         key = typer.prompt("Please enter your Flavortown User ID")
@@ -37,10 +43,38 @@ def hackatime(key: str = typer.Argument(None, help="Your Hackatime API key")):
     console.print(f"Successfully logged in with Hackatime API key!", style="green")
 
 @app.command("hackatimeuser")
-def hackatimeuser(username: str = typer.Argument(None, help="Your Hackatime username")):
+def hackatimeuser(username: str = typer.Argument(None, help="Your Hackatime username", autocompletion=autocomplete_usernames)):
     """Set your Hackatime username."""
     if username is None:
         username = typer.prompt("Please enter your Hackatime username")
 
     set_hackatime_username(username)
     console.print(f"Successfully set Hackatime username to {username}!", style="green")
+
+@app.command("profiles")
+def profiles():
+    """List your credential profiles (select one with 'flavor --profile NAME ...')."""
+    active = get_active_profile()
+    table = Table(title="Profiles")
+    table.add_column("Profile", style="cyan")
+    table.add_column("API Key", justify="center")
+    table.add_column("Flavor ID", style="magenta")
+    table.add_column("Hackatime Key", justify="center")
+    table.add_column("Hackatime User", style="green")
+
+    names = list_profiles()
+    if active not in names:
+        names.append(active)
+
+    for name in names:
+        with use_profile(name):
+            label = f"{name} (active)" if name == active else name
+            table.add_row(
+                label,
+                "✓" if get_api_key() else "-",
+                get_flavor_id() or "-",
+                "✓" if get_hackatime_key() else "-",
+                get_hackatime_username() or "-",
+            )
+
+    console.print(table)
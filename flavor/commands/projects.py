@@ -1,12 +1,23 @@
+import re
 import typer
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import List
+from urllib.parse import urlsplit
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
 from rich.align import Align
 from flavor.api import get_project, get_user_by_id, create_project, update_project, APIError
-from flavor.config import get_flavor_id, get_api_key, set_flavor_id
+from flavor.completion import autocomplete_project_ids
+from flavor.config import get_flavor_id, get_api_key, set_flavor_id, get_hackatime_username
+from flavor.hackatime import get_stats, HackatimeAPIError
+from flavor.http import restart_deadline
+from flavor.store import is_offline, print_staleness
+from flavor.urlcheck import check_urls, describe
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
@@ -158,8 +169,44 @@ def _project_form(existing: dict = None) -> dict:
     
     return fields
 
+_URL_FIELDS = [("repo_url", "Repo URL"), ("demo_url", "Demo URL"), ("readme_url", "README URL")]
+
+def _validate_urls(fields: dict) -> bool:
+    """
+    Check the form's links before submitting.
+    Returns True if it's fine to continue (all links work, or the user says so).
+    """
+    urls = {key: fields.get(key) for key, _ in _URL_FIELDS if fields.get(key)}
+    if not urls or is_offline():
+        return True
+
+    with console.status("Checking links...", spinner="dots"):
+        results = check_urls(urls.values())
+
+    broken = [key for key, url in urls.items() if not results[url]["ok"]]
+    if not broken:
+        console.print("[green]✓ All links are reachable[/green]")
+        console.print()
+        return True
+
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Field", style="cyan")
+    table.add_column("URL", style="white")
+    table.add_column("Status")
+    for key, label in _URL_FIELDS:
+        if key in urls:
+            result = results[urls[key]]
+            style = "green" if result["ok"] else "red"
+            table.add_row(label, urls[key], f"[{style}]{describe(result)}[/{style}]")
+    console.print("[bold yellow]⚠️  Some links don't seem to work[/bold yellow]")
+    console.print(table)
+    console.print()
+    return Confirm.ask("[yellow]Submit anyway?[/yellow]", default=False)
+
 @app.command("create")
-def project_create():
+def project_create(
+    check_links: bool = typer.Option(True, "--check-links/--no-check-links", help="Check that the project's URLs work before submitting."),
+):
     """Create a new project with an interactive form."""
     console.print()
     console.print("[bold cyan]🚀 Create New Project[/bold cyan]")
@@ -176,6 +223,10 @@ def project_create():
     
     try:
         fields = _project_form()
+
+        if check_links and not _validate_urls(fields):
+            console.print("[dim]Cancelled.[/dim]")
+            raise typer.Exit()
         
         # Preview
         console.print("[bold]Preview[/bold]")
@@ -201,7 +252,8 @@ def project_create():
             console.print("[dim]Cancelled.[/dim]")
             raise typer.Exit()
         
-        # Submit
+        # Submit, with a fresh time budget after however long the form took
+        restart_deadline()
         with console.status("Creating project...", spinner="dots"):
             result = create_project(
                 title=fields["title"],
@@ -220,7 +272,10 @@ def project_create():
         raise typer.Exit(code=1)
 
 @app.command("edit")
-def project_edit(project_id: int = typer.Argument(None, help="The ID of the project to edit")):
+def project_edit(
+    project_id: int = typer.Argument(None, help="The ID of the project to edit", autocompletion=autocomplete_project_ids),
+    check_links: bool = typer.Option(True, "--check-links/--no-check-links", help="Check that the project's URLs work before submitting."),
+):
     """Edit an existing project with an interactive form."""
     if project_id is None:
         project_id = int(Prompt.ask("Enter the project ID to edit"))
@@ -274,6 +329,10 @@ def project_edit(project_id: int = typer.Argument(None, help="The ID of the proj
         if not updates:
             console.print("[yellow]No changes made.[/yellow]")
             raise typer.Exit()
+
+        if check_links and not _validate_urls(updates):
+            console.print("[dim]Cancelled.[/dim]")
+            raise typer.Exit()
         
         # Preview changes
         console.print("[bold]Changes to Apply[/bold]")
@@ -296,7 +355,8 @@ def project_edit(project_id: int = typer.Argument(None, help="The ID of the proj
             console.print("[dim]Cancelled.[/dim]")
             raise typer.Exit()
         
-        # Submit
+        # Submit, with a fresh time budget after however long the form took
+        restart_deadline()
         with console.status("Updating project...", spinner="dots"):
             result = update_project(
                 project_id=project_id,
@@ -316,7 +376,7 @@ def project_edit(project_id: int = typer.Argument(None, help="The ID of the proj
         raise typer.Exit(code=1)
 
 @app.command("view")
-def project_view(project_id: int = typer.Argument(None, help="The ID of the project to view")):
+def project_view(project_id: int = typer.Argument(None, help="The ID of the project to view", autocompletion=autocomplete_project_ids)):
     """View details of a specific project."""
     if project_id is None:
         project_id = int(Prompt.ask("Enter the project ID to view"))
@@ -332,7 +392,216 @@ def project_view(project_id: int = typer.Argument(None, help="The ID of the proj
         devlog_ids = project.get("devlog_ids", [])
         if devlog_ids:
             console.print(f"\n[cyan]Devlogs:[/cyan] {', '.join(map(str, devlog_ids))}")
+
+        print_staleness(console)
         
     except APIError as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
         raise typer.Exit(code=1)
+
+@app.command("check")
+def project_check(
+    project_ids: List[int] = typer.Argument(None, help="Projects to check (default: all of yours)", autocompletion=autocomplete_project_ids),
+):
+    """Check that the repo, demo and README links of projects work."""
+    if not project_ids:
+        with console.status("Verifying your identity...", spinner="dots"):
+            user_data = _check_authenticated()
+        project_ids = user_data.get("project_ids", [])
+        if not project_ids:
+            console.print("[yellow]You don't have any projects yet. Create one with 'flavor projects create'.[/yellow]")
+            return
+
+    projects = []
+    with console.status(f"Fetching {len(project_ids)} projects...", spinner="dots"):
+        with ThreadPoolExecutor(max_workers=min(8, len(project_ids))) as pool:
+            futures = {pool.submit(get_project, pid): pid for pid in project_ids}
+            for future, pid in futures.items():
+                try:
+                    projects.append(future.result())
+                except APIError as e:
+                    console.print(f"[red]Failed to fetch project {pid}: {e}[/red]")
+
+    if not projects:
+        raise typer.Exit(code=1)
+
+    urls = [p.get(key) for p in projects for key, _ in _URL_FIELDS]
+    offline = is_offline()
+    if offline:
+        # Probing links is network access too
+        results = {}
+    else:
+        with console.status(f"Checking {len({u for u in urls if u})} links...", spinner="dots"):
+            results = check_urls(urls)
+
+    table = Table(title="Project Links")
+    table.add_column("ID", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Title", style="magenta")
+    table.add_column("Field", style="blue")
+    table.add_column("URL", style="white")
+    table.add_column("Status")
+
+    broken = 0
+    for project in projects:
+        for key, label in _URL_FIELDS:
+            url = project.get(key)
+            if not url:
+                status = "[dim]not set[/dim]"
+            elif offline:
+                status = "[yellow]not checked (offline)[/yellow]"
+            elif results[url]["ok"]:
+                status = f"[green]{describe(results[url])}[/green]"
+            else:
+                status = f"[red]{describe(results[url])}[/red]"
+                broken += 1
+            table.add_row(str(project.get("id")), project.get("title") or "Unknown", label, url or "-", status)
+
+    console.print(table)
+    if broken:
+        console.print(f"[bold red]{broken} broken link(s) found.[/bold red]")
+        raise typer.Exit(code=1)
+    if offline:
+        console.print("[yellow]Links were not checked in offline mode.[/yellow]")
+        return
+    console.print("[bold green]✅ All links work![/bold green]")
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", (name or "").lower())
+
+def _join_keys(project: dict) -> list:
+    """Names a Hackatime project could be tracked under: the title and the repo name."""
+    keys = [_normalize(project.get("title"))]
+    repo_url = project.get("repo_url")
+    if repo_url:
+        repo = urlsplit(repo_url).path.rstrip("/").rsplit("/", 1)[-1]
+        if repo.endswith(".git"):
+            repo = repo[:-4]
+        keys.append(_normalize(repo))
+    return list(dict.fromkeys(key for key in keys if key))
+
+def _join_report(project_ids: list, metas: dict, by_key: dict):
+    """
+    Probe the Hackatime hash table with each project's join keys. Projects are
+    joined in profile order, so when two of them match the same Hackatime
+    project the time always goes to the same one. Returns (rows, claimed names).
+    """
+    rows, claimed = [], set()
+    for pid in project_ids:
+        meta = metas.get(str(pid))
+        if meta is None:
+            continue
+        seconds, matched = 0, []
+        for key in meta["keys"]:
+            for ht_project in by_key.get(key, []):
+                if ht_project.get("name") in claimed:
+                    continue
+                claimed.add(ht_project.get("name"))
+                matched.append(ht_project.get("name"))
+                seconds += ht_project.get("total_seconds") or 0
+        rows.append({"id": pid, "title": meta["title"], "seconds": seconds, "matched": matched})
+    return rows, claimed
+
+def _report_table(rows: list, sort: str, expected: int) -> Table:
+    table = Table(title=f"Time per Project ({len(rows)}/{expected})")
+    table.add_column("ID", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Title", style="magenta")
+    table.add_column("Hours", justify="right", style="green")
+    table.add_column("Hackatime Projects", style="dim")
+
+    if sort == "title":
+        rows = sorted(rows, key=lambda row: row["title"].lower())
+    else:
+        rows = sorted(rows, key=lambda row: row["seconds"], reverse=True)
+    for row in rows:
+        hours = f"{row['seconds'] / 3600:.1f}" if row["seconds"] else "[dim]0.0[/dim]"
+        table.add_row(str(row["id"]), row["title"], hours, ", ".join(row["matched"]) or "-")
+    return table
+
+@app.command("report")
+def project_report(
+    sort: str = typer.Option("hours", "--sort", "-s", help="Sort by hours or title."),
+):
+    """
+    Show the Hackatime coding time of each of your projects.
+
+    Projects are matched to Hackatime by title or repository name.
+    """
+    if sort not in ("hours", "title"):
+        raise typer.BadParameter("Sort by hours or title.", param_hint="--sort")
+    flavor_id = get_flavor_id()
+    ht_username = get_hackatime_username()
+    if not flavor_id or not ht_username:
+        console.print("[bold red]❌ You need both your Flavor ID and Hackatime username set.[/bold red]")
+        console.print("[dim]Run 'flavor login id' and 'flavor login hackatimeuser'.[/dim]")
+        raise typer.Exit(code=1)
+
+    try:
+        user_id = int(flavor_id)
+    except ValueError:
+        console.print("[bold red]❌ Stored Flavor ID is not a valid integer.[/bold red]")
+        raise typer.Exit(code=1)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        # Both sides are fetched at once
+        user_future = pool.submit(get_user_by_id, user_id)
+        stats_future = pool.submit(get_stats, ht_username, "projects")
+        try:
+            with console.status("Fetching your projects and Hackatime stats...", spinner="dots"):
+                project_ids = user_future.result().get("project_ids", [])
+                stats = stats_future.result()
+        except (APIError, HackatimeAPIError) as e:
+            console.print(f"[bold red]Error: {e}[/bold red]")
+            raise typer.Exit(code=1)
+
+        if not project_ids:
+            console.print("[yellow]You don't have any projects yet. Create one with 'flavor projects create'.[/yellow]")
+            return
+
+        ht_projects = (stats.get("data") or {}).get("projects")
+        if ht_projects is None:
+            console.print("[yellow]Hackatime didn't return per-project time for your account.[/yellow]")
+            return
+
+        # Build side of the hash join: normalized Hackatime name -> projects
+        by_key = {}
+        for ht_project in ht_projects:
+            by_key.setdefault(_normalize(ht_project.get("name")), []).append(ht_project)
+
+        # Project details are served from the response store and refreshed
+        # when stale, so renamed projects re-join without refetching them all
+        metas = {}
+        rows, claimed = _join_report(project_ids, metas, by_key)
+        futures = {pool.submit(get_project, pid): pid for pid in project_ids}
+
+        errors = []
+        live = Live(_report_table(rows, sort, len(project_ids)), console=console, auto_refresh=False)
+        with live if console.is_terminal else nullcontext():
+            for future in as_completed(futures):
+                pid = futures[future]
+                try:
+                    project = future.result()
+                except APIError as e:
+                    errors.append(f"Failed to fetch project {pid}: {e}")
+                    continue
+                metas[str(pid)] = {"title": project.get("title") or "Unknown", "keys": _join_keys(project)}
+                rows, claimed = _join_report(project_ids, metas, by_key)
+                if console.is_terminal:
+                    live.update(_report_table(rows, sort, len(project_ids)), refresh=True)
+
+    if not console.is_terminal:
+        console.print(_report_table(rows, sort, len(project_ids)))
+
+    for error in errors:
+        console.print(f"[red]{error}[/red]")
+
+    tracked = sum(row["seconds"] for row in rows)
+    untracked = [p for p in ht_projects if p.get("name") not in claimed and p.get("total_seconds")]
+    console.print(f"[bold]Total:[/bold] [green]{tracked / 3600:.1f}h[/green] on Flavortown projects")
+    if untracked:
+        untracked.sort(key=lambda p: p.get("total_seconds") or 0, reverse=True)
+        names = ", ".join(p.get("name") or "?" for p in untracked[:3])
+        more = f" and {len(untracked) - 3} more" if len(untracked) > 3 else ""
+        hours = sum(p.get("total_seconds") or 0 for p in untracked) / 3600
+        console.print(f"[dim]{hours:.1f}h in Hackatime projects not linked to any ({names}{more}).[/dim]")
+
+    print_staleness(console)
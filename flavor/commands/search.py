@@ -1,21 +1,230 @@
+import threading
+import time
 import typer
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
+from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from flavor.api import get_users, get_projects, APIError
+from flavor.completion import autocomplete_user_names, autocomplete_project_titles
+from flavor.http import set_deadline
+from flavor.pager import Pager
+from flavor.prefetch import prefetch_in_background
+from flavor.store import print_staleness
+from flavor.tables import USER_COLUMNS, PROJECT_COLUMNS, make_table, user_row, project_row
+from flavor.tui import raw_terminal, read_key, is_interactive
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
-@app.callback()
-def callback():
+# Interactive finder tuning
+DEBOUNCE_SECONDS = 0.3
+MAX_VISIBLE_RESULTS = 15
+
+@app.callback(invoke_without_command=True)
+def callback(
+    ctx: typer.Context,
+    interactive: bool = typer.Option(False, "--interactive", "-i", help="Search projects as you type."),
+):
     """
     Search - specific resources.
     """
-    pass
+    if ctx.invoked_subcommand is not None:
+        return
+    if not interactive:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+    if not is_interactive():
+        console.print("Interactive search needs a terminal.", style="bold red")
+        raise typer.Exit(code=1)
+
+    # The finder stays open as long as the user types, only requests are bounded
+    set_deadline(None)
+    selected = _ProjectFinder().run()
+    if selected is not None:
+        # Imported here so the finder doesn't pull in the projects TUI unless needed
+        from flavor.commands.projects import project_view
+        project_view(selected)
+
+def _matches(project: dict, query: str) -> bool:
+    query = query.lower()
+    title = (project.get("title") or "").lower()
+    desc = (project.get("description") or "").lower()
+    return query in title or query in desc
+
+class _ProjectFinder:
+    """
+    Search-as-you-type project finder.
+
+    Keystrokes are debounced before a request is made, and every request is
+    tagged with a generation number so that responses for superseded queries
+    are dropped instead of overwriting newer results. Results are cached by
+    query: an exact hit (e.g. after backspacing) is shown immediately, and when
+    refining a query the longest cached prefix is filtered locally while the
+    real request is in flight.
+    """
+
+    def __init__(self):
+        self.query = ""
+        self.results = []
+        self.selected = 0
+        self.status = "Type to search projects."
+        self.cache = {}
+        self.generation = 0
+        self.pending_since = None
+        self.lock = threading.Lock()
+
+    def _cached_results(self, query: str):
+        """Return (results, exact) from the prefix cache, or (None, False)."""
+        if query in self.cache:
+            return self.cache[query], True
+        for end in range(len(query) - 1, 0, -1):
+            prefix = query[:end]
+            if prefix in self.cache:
+                return [p for p in self.cache[prefix] if _matches(p, query)], False
+        return None, False
+
+    def _on_query_changed(self):
+        with self.lock:
+            # Any request still in flight is now stale
+            self.generation += 1
+            self.selected = 0
+
+            if not self.query.strip():
+                self.results = []
+                self.status = "Type to search projects."
+                self.pending_since = None
+                return
+
+            results, exact = self._cached_results(self.query)
+            if results is not None:
+                self.results = results
+            if exact:
+                self.status = f"{len(results)} result(s) (cached)"
+                self.pending_since = None
+            else:
+                self.status = "Searching..."
+                self.pending_since = time.monotonic()
+
+    def _fetch(self, query: str, generation: int):
+        try:
+            data = get_projects(page=1, query=query)
+            projects = data.get("projects", [])
+            error = None
+        except APIError as e:
+            projects, error = None, str(e)
+
+        with self.lock:
+            if generation != self.generation:
+                return
+            if error:
+                self.status = f"Error: {error}"
+                return
+            self.cache[query] = projects
+            self.results = projects
+            self.selected = min(self.selected, max(len(projects) - 1, 0))
+            self.status = f"{len(projects)} result(s)"
+
+    def _render(self):
+        prompt = Text.assemble(("Search projects: ", "bold cyan"), self.query, ("▏", "blink"))
+
+        table = Table(expand=True)
+        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
+        table.add_column("Title", style="magenta")
+        table.add_column("Description", style="white")
+
+        with self.lock:
+            results = list(self.results)
+            selected = self.selected
+            status = self.status
+
+        start = max(0, selected - MAX_VISIBLE_RESULTS + 1)
+        for index, project in enumerate(results[start:start + MAX_VISIBLE_RESULTS], start=start):
+            desc = project.get("description") or "-"
+            if len(desc) > 50:
+                desc = desc[:47] + "..."
+            table.add_row(
+                str(project.get("id")),
+                project.get("title") or "Unknown",
+                desc,
+                style="reverse" if index == selected else None,
+            )
+
+        footer = Text(f"{status}  •  ↑/↓ select  •  Enter open  •  Esc quit", style="dim")
+        return Panel(Group(prompt, table, footer), title="[bold magenta]Project Finder[/bold magenta]", border_style="magenta")
+
+    def run(self):
+        """Run the finder, returns the selected project ID or None."""
+        with raw_terminal(), Live(self._render(), console=console, auto_refresh=False, transient=True) as live:
+            while True:
+                try:
+                    key = read_key(timeout=0.05)
+                except KeyboardInterrupt:
+                    return None
+
+                if key == "escape":
+                    return None
+                if key == "enter":
+                    with self.lock:
+                        if self.results:
+                            return self.results[self.selected].get("id")
+                elif key == "up":
+                    with self.lock:
+                        self.selected = max(self.selected - 1, 0)
+                elif key == "down":
+                    with self.lock:
+                        self.selected = min(self.selected + 1, max(len(self.results) - 1, 0))
+                elif key == "backspace":
+                    if self.query:
+                        self.query = self.query[:-1]
+                        self._on_query_changed()
+                elif key is not None and len(key) == 1 and key.isprintable():
+                    self.query += key
+                    self._on_query_changed()
+
+                if self.pending_since is not None and time.monotonic() - self.pending_since >= DEBOUNCE_SECONDS:
+                    self.pending_since = None
+                    threading.Thread(
+                        target=self._fetch, args=(self.query, self.generation), daemon=True
+                    ).start()
+
+                live.update(self._render(), refresh=True)
+
+def _run_pager(title: str, columns: list, fetch, key: str, format_row, query: str, page: int):
+    if not is_interactive():
+        console.print("The pager needs a terminal.", style="bold red")
+        raise typer.Exit(code=1)
+
+    def fetch_page(p: int):
+        data = fetch(page=p, query=query)
+        pagination = data.get("pagination", {})
+        return data.get(key, []), pagination.get("total_pages"), pagination.get("total_count")
+
+    try:
+        view = Pager(title, columns, fetch_page, format_row, console)
+        with console.status(f"Searching for '{query}' (page {page})...", spinner="dots"):
+            view.load(start_page=page)
+        if not any(view.pages.values()):
+            console.print(f"No results found matching '{query}'.", style="yellow")
+            return
+        view.run()
+    except APIError as e:
+        console.print(f"Error: {e}", style="bold red")
 
 @app.command("users")
-def search_users(query: str, page: int = 1):
+def search_users(
+    query: str = typer.Argument(..., autocompletion=autocomplete_user_names),
+    page: int = 1,
+    pager: bool = typer.Option(False, "--pager", help="Scroll through all results, loading pages as needed."),
+    prefetch: bool = typer.Option(False, "--prefetch", envvar="FLAVOR_PREFETCH", help="Fetch the next page in the background so it shows up instantly."),
+):
     """Search for users by display name or Slack ID."""
+    if pager:
+        _run_pager(f"Search Results for '{query}'", USER_COLUMNS, get_users, "users", user_row, query, page)
+        return
+
     try:
         with console.status(f"Searching for '{query}' (page {page})...", spinner="dots"):
             data = get_users(page=page, query=query)
@@ -31,19 +240,9 @@ def search_users(query: str, page: int = 1):
         current_page = pagination.get("current_page", page)
         total_pages = pagination.get("total_pages", "Unknown")
         
-        title = f"Search Results for '{query}'"
-        table = Table(title=title)
-        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Display Name", style="magenta")
-        table.add_column("Slack ID", style="green")
-        table.add_column("Cookies", justify="right", style="yellow")
-
+        table = make_table(f"Search Results for '{query}'", USER_COLUMNS)
         for user in users_list:
-            d_name = user.get("display_name") or "Unknown"
-            s_id = user.get("slack_id") or "N/A"
-            c_count = str(user.get("cookies") if user.get("cookies") is not None else 0)
-            
-            table.add_row(str(user.get("id")), d_name, s_id, c_count)
+            table.add_row(*user_row(user))
         
         console.print(table)
         
@@ -58,13 +257,26 @@ def search_users(query: str, page: int = 1):
         
         if isinstance(total_pages, int) and current_page < total_pages:
              console.print(f"[dim]Tip: Use 'flavor search users \"{query}\" --page {page + 1}' to see the next page.[/dim]", justify="center")
+             if prefetch:
+                 prefetch_in_background("users", page=page + 1, query=query)
+
+        print_staleness(console)
 
     except APIError as e:
         console.print(f"Error: {e}", style="bold red")
 
 @app.command("projects")
-def search_projects(query: str, page: int = 1):
+def search_projects(
+    query: str = typer.Argument(..., autocompletion=autocomplete_project_titles),
+    page: int = 1,
+    pager: bool = typer.Option(False, "--pager", help="Scroll through all results, loading pages as needed."),
+    prefetch: bool = typer.Option(False, "--prefetch", envvar="FLAVOR_PREFETCH", help="Fetch the next page in the background so it shows up instantly."),
+):
     """Search for projects by title or description."""
+    if pager:
+        _run_pager(f"Search Results for Project '{query}'", PROJECT_COLUMNS, get_projects, "projects", project_row, query, page)
+        return
+
     try:
         with console.status(f"Searching for project '{query}' (page {page})...", spinner="dots"):
             data = get_projects(page=page, query=query)
@@ -80,23 +292,9 @@ def search_projects(query: str, page: int = 1):
         current_page = pagination.get("current_page", page)
         total_pages = pagination.get("total_pages", "Unknown")
         
-        title = f"Search Results for Project '{query}'"
-        table = Table(title=title)
-        
-        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Title", style="magenta")
-        table.add_column("Description", style="white")
-        table.add_column("Repo URL", style="blue")
-        
+        table = make_table(f"Search Results for Project '{query}'", PROJECT_COLUMNS)
         for project in projects:
-            p_id = str(project.get("id"))
-            title = project.get("title") or "Unknown"
-            desc = project.get("description") or "-"
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
-            repo = project.get("repo_url") or "-"
-            
-            table.add_row(p_id, title, desc, repo)
+            table.add_row(*project_row(project))
             
         console.print(table)
         
@@ -112,5 +310,15 @@ def search_projects(query: str, page: int = 1):
         if isinstance(total_pages, int) and current_page < total_pages:
              console.print(f"[dim]Tip: Use 'flavor search projects \"{query}\" --page {page + 1}' to see the next page.[/dim]", justify="center")
 
+        if prefetch:
+            # Details of the listed projects too, for a follow-up 'projects view'
+            has_next = isinstance(total_pages, int) and current_page < total_pages
+            prefetch_in_background(
+                "projects", page=page + 1 if has_next else None, query=query,
+                project_ids=[p.get("id") for p in projects if p.get("id") is not None],
+            )
+
+        print_staleness(console)
+
     except APIError as e:
         console.print(f"Error: {e}", style="bold red")
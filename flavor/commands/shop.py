@@ -0,0 +1,105 @@
+import typer
+from typing import List
+from rich.console import Console
+from rich.table import Table
+from flavor.config import get_flavor_id
+from flavor.api import get_shop, get_user_by_id, APIError
+from flavor.planner import Choice, plan as plan_basket
+from flavor.store import print_staleness
+
+app = typer.Typer(no_args_is_help=True)
+console = Console()
+
+_GOALS = ("items", "spend")
+
+def _parse_weights(weights: list) -> dict:
+    """Parse "ITEM_ID=WEIGHT" entries."""
+    parsed = {}
+    for entry in weights or []:
+        item_id, _, weight = entry.partition("=")
+        try:
+            parsed[int(item_id)] = float(weight)
+        except ValueError:
+            raise typer.BadParameter(f"'{entry}' is not in the form ITEM_ID=WEIGHT.")
+        if parsed[int(item_id)] < 0:
+            raise typer.BadParameter(f"The weight for item {item_id} can't be negative.")
+    return parsed
+
+def _choices(items: list, goal: str, weights: dict, max_each: int) -> list:
+    choices = []
+    for item in items:
+        ticket_cost = item.get("ticket_cost") or {}
+        cost = ticket_cost.get("base_cost")
+        if item.get("id") is None or not isinstance(cost, (int, float)):
+            continue
+        cost = int(cost)
+
+        limit = max_each
+        if item.get("limited"):
+            limit = 1
+        if item.get("stock") is not None:
+            limit = min(limit, max(int(item["stock"]), 0))
+
+        value = cost if goal == "spend" else weights.get(item["id"], 1)
+        choices.append(Choice(item["id"], cost, value, limit))
+    return choices
+
+@app.command("plan")
+def plan(
+    budget: int = typer.Option(None, "--budget", "-b", min=0, help="Cookies to spend (defaults to your current balance)."),
+    goal: str = typer.Option("items", "--goal", "-g", help="'items' to get as many items as possible, 'spend' to use as many cookies as possible."),
+    weight: List[str] = typer.Option(None, "--weight", "-w", help="Priority of an item as ITEM_ID=WEIGHT (default 1, 0 to exclude). Can be repeated."),
+    max_each: int = typer.Option(1, "--max-each", min=1, help="Most copies of a single item to buy."),
+):
+    """Work out the best basket of shop items you can afford."""
+    if goal not in _GOALS:
+        raise typer.BadParameter(f"Goal must be one of: {', '.join(_GOALS)}.", param_hint="--goal")
+    weights = _parse_weights(weight)
+
+    try:
+        with console.status("Fetching shop items...", spinner="dots"):
+            items = get_shop()
+            if budget is None:
+                flavor_id = get_flavor_id()
+                if not flavor_id:
+                    console.print("Pass --budget or login with your Flavor ID first using 'flavor login id <id>'", style="bold red")
+                    raise typer.Exit(code=1)
+                budget = get_user_by_id(int(flavor_id)).get("cookies") or 0
+    except APIError as e:
+        console.print(f"Error: {e}", style="bold red")
+        raise typer.Exit(code=1)
+    except ValueError:
+        console.print("Stored Flavor ID is not a valid integer.", style="bold red")
+        raise typer.Exit(code=1)
+
+    by_id = {item.get("id"): item for item in items or []}
+    result = plan_basket(_choices(items or [], goal, weights, max_each), budget)
+
+    if not result["quantities"]:
+        console.print(f"Nothing in the shop fits a budget of {budget} cookies.", style="yellow")
+    else:
+        table = Table(title=f"Best basket for {budget} cookies")
+        table.add_column("ID", justify="right", style="cyan", no_wrap=True)
+        table.add_column("Name", style="magenta")
+        table.add_column("Qty", justify="right")
+        table.add_column("Cost", justify="right", style="green")
+        table.add_column("Subtotal", justify="right", style="green")
+
+        rows = sorted(result["quantities"].items(), key=lambda kv: by_id[kv[0]]["ticket_cost"]["base_cost"], reverse=True)
+        for item_id, quantity in rows:
+            cost = int(by_id[item_id]["ticket_cost"]["base_cost"])
+            table.add_row(str(item_id), by_id[item_id].get("name") or "Unknown", str(quantity), str(cost), str(cost * quantity))
+        console.print(table)
+
+        count = sum(result["quantities"].values())
+        console.print(
+            f"[bold]{count}[/bold] item(s) for [bold yellow]{result['cost']}[/bold yellow] cookies,"
+            f" [bold]{budget - result['cost']}[/bold] left over.",
+            style="green",
+        )
+        if weights and goal == "items":
+            console.print(f"[dim]Total priority: {result['value']:g}[/dim]")
+        if not result["optimal"]:
+            console.print("[dim yellow]The search was cut short, this is the best basket found in time.[/dim yellow]")
+
+    print_staleness(console)
@@ -1,13 +1,87 @@
+import time
 import typer
-from rich.console import Console
+from datetime import datetime
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
 from flavor.hackatime import get_time_today, HackatimeAPIError
+from flavor.http import set_deadline
+from flavor.store import is_offline
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
+# Watch mode polling: start at the minimum interval, stretch it while the
+# total stays the same, and snap back as soon as it changes.
+MAX_POLL_SECONDS = 300
+BACKOFF_FACTOR = 1.5
+
+def _render_today(data: dict, status: str):
+    today_data = data.get("data", {}) if data else {}
+    grand_total = today_data.get("grand_total", {})
+    text = grand_total.get("text", "0 secs")
+
+    headline = Text.assemble("You have coded for ", (text, "bold cyan"), " today!", style="green")
+
+    languages = today_data.get("languages") or []
+    if not languages:
+        return Group(headline, Text(status, style="dim"))
+
+    table = Table(title="Languages Today")
+    table.add_column("Language", style="blue")
+    table.add_column("Time", style="green")
+    table.add_column("Share", justify="right", style="yellow")
+    for language in sorted(languages, key=lambda x: x.get("total_seconds", 0), reverse=True):
+        percent = language.get("percent")
+        share = f"{percent:.1f}%" if isinstance(percent, (int, float)) else "-"
+        table.add_row(language.get("name", "Unknown"), language.get("text", "0 secs"), share)
+
+    return Group(headline, table, Text(status, style="dim"))
+
+def _watch(interval: int):
+    data = None
+    last_total = None
+    delay = interval
+
+    with Live(_render_today(None, "Fetching your coding time..."), console=console, auto_refresh=False) as live:
+        while True:
+            try:
+                data = get_time_today()
+                total = data.get("data", {}).get("grand_total", {}).get("total_seconds")
+                if total == last_total:
+                    delay = min(delay * BACKOFF_FACTOR, MAX_POLL_SECONDS)
+                else:
+                    delay = interval
+                last_total = total
+                status = f"Updated {datetime.now():%H:%M:%S}"
+            except HackatimeAPIError as e:
+                delay = min(delay * BACKOFF_FACTOR, MAX_POLL_SECONDS)
+                status = f"Error: {e}"
+
+            next_check = datetime.fromtimestamp(time.time() + delay)
+            status += f" • next check at {next_check:%H:%M:%S} • Ctrl+C to stop"
+            live.update(_render_today(data, status), refresh=True)
+            time.sleep(delay)
+
 @app.command("today")
-def today():
+def today(
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep the view open and update it as you code."),
+    interval: int = typer.Option(30, "--interval", min=5, help="Fastest polling interval in seconds for --watch."),
+):
     """Show how much you've coded today."""
+    if watch:
+        if is_offline():
+            console.print("Watch mode needs a connection to Hackatime.", style="bold red")
+            raise typer.Exit(code=1)
+        # Runs all day, so only individual requests are bounded
+        set_deadline(None)
+        try:
+            _watch(interval)
+        except KeyboardInterrupt:
+            pass
+        return
+
     try:
         with console.status("Fetching your coding time...", spinner="dots"):
             data = get_time_today()
@@ -0,0 +1,303 @@
+# flavor/completion.py
+#
+# Shell completion for dynamic arguments (project IDs, user IDs, names).
+#
+# TAB presses are answered from a small local index that is filled in as a
+# side effect of normal API calls. This module must stay cheap to import: the
+# completion fast path in flavor/__main__.py uses it before (and instead of)
+# importing typer, rich or requests.
+import atexit
+import functools
+import json
+import os
+import shlex
+import sys
+import threading
+import time
+from flavor.config import DATA_FILE, get_active_profile, get_flavor_id
+
+# This would be ~/.flavorlinetool/completion.json next to data.json
+INDEX_FILE = DATA_FILE.parent / "completion.json"
+# Background refresh of your own projects when the index is older than this
+REFRESH_SECONDS = 6 * 60 * 60
+# Don't start another background refresh while one was started this recently
+REFRESH_COOLDOWN_SECONDS = 5 * 60
+# How many entries of each kind are kept, least recently seen are dropped
+MAX_ENTRIES = 500
+
+_GLOBAL_FLAGS = {"--offline", "--refresh"}
+_GLOBAL_OPTIONS = {"--profile", "-p"}
+
+_pending = {"projects": {}, "users": {}, "usernames": {}, "own_projects": {}}
+_pending_lock = threading.Lock()
+_flush_registered = False
+
+def _empty_index() -> dict:
+    return {"refreshed_at": 0, "refresh_started_at": 0, "projects": {}, "users": {}, "usernames": {}, "own_projects": {}}
+
+def load_index() -> dict:
+    try:
+        with open(INDEX_FILE, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return _empty_index()
+    for key, value in _empty_index().items():
+        index.setdefault(key, value)
+    return index
+
+def _save_index(index: dict):
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = INDEX_FILE.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp, INDEX_FILE)
+
+def _trim(entries: dict, seen_at) -> dict:
+    if len(entries) <= MAX_ENTRIES:
+        return entries
+    newest = sorted(entries.items(), key=lambda item: seen_at(item[1]), reverse=True)
+    return dict(newest[:MAX_ENTRIES])
+
+def flush(refreshed: bool = False):
+    """Merge everything remembered by this process into the index file."""
+    with _pending_lock:
+        pending = {kind: dict(entries) for kind, entries in _pending.items()}
+        for entries in _pending.values():
+            entries.clear()
+    if not any(pending.values()) and not refreshed:
+        return
+
+    index = load_index()
+    index["projects"].update(pending["projects"])
+    index["users"].update(pending["users"])
+    index["usernames"].update(pending["usernames"])
+    index["own_projects"].update(pending["own_projects"])
+    index["projects"] = _trim(index["projects"], lambda entry: entry[1])
+    index["users"] = _trim(index["users"], lambda entry: entry[1])
+    index["usernames"] = _trim(index["usernames"], lambda seen: seen)
+    if refreshed:
+        index["refreshed_at"] = time.time()
+    try:
+        _save_index(index)
+    except OSError:
+        pass
+
+def _remember(kind: str, key, value):
+    global _flush_registered
+    with _pending_lock:
+        _pending[kind][str(key)] = value
+        if not _flush_registered:
+            atexit.register(flush)
+            _flush_registered = True
+
+def _remember_project(project: dict):
+    if isinstance(project, dict) and project.get("id") is not None:
+        _remember("projects", project["id"], [project.get("title") or "", time.time()])
+
+def _remember_user(user: dict, profile: str = None, own_id: str = None):
+    if not isinstance(user, dict) or user.get("id") is None:
+        return
+    _remember("users", user["id"], [user.get("display_name") or "", time.time()])
+    if profile is not None and str(user["id"]) == str(own_id) and isinstance(user.get("project_ids"), list):
+        _remember("own_projects", profile, user["project_ids"])
+
+def remember_username(username: str):
+    if username:
+        _remember("usernames", username, time.time())
+
+def remembered(func):
+    """Record the projects and users in a Flavortown API response for completion."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        try:
+            if isinstance(result, dict):
+                for project in result.get("projects") or []:
+                    _remember_project(project)
+                for user in result.get("users") or []:
+                    _remember_user(user)
+                if "title" in result:
+                    _remember_project(result)
+                elif "display_name" in result:
+                    _remember_user(result, get_active_profile(), get_flavor_id())
+        except Exception:
+            # Completion data is best effort, never break the actual command
+            pass
+        return result
+    return wrapper
+
+def _matches(value: str, incomplete: str) -> bool:
+    return value.lower().startswith(incomplete.lower())
+
+def complete_project_ids(incomplete: str, profile: str = "default") -> list:
+    """Project IDs, yours first, as (value, help) pairs."""
+    index = load_index()
+    projects = index["projects"]
+    own = [str(pid) for pid in index["own_projects"].get(profile, [])]
+    others = sorted(projects, key=lambda pid: projects[pid][1], reverse=True)
+    ordered = own + [pid for pid in others if pid not in own]
+    return [(pid, (projects.get(pid) or [""])[0]) for pid in ordered if pid.startswith(incomplete)]
+
+def complete_project_titles(incomplete: str, profile: str = "default") -> list:
+    titles = {entry[0] for entry in load_index()["projects"].values() if entry[0]}
+    return [(title, None) for title in sorted(titles) if _matches(title, incomplete)]
+
+def complete_user_ids(incomplete: str, profile: str = "default") -> list:
+    users = load_index()["users"]
+    ordered = sorted(users, key=lambda uid: users[uid][1], reverse=True)
+    return [(uid, users[uid][0]) for uid in ordered if uid.startswith(incomplete)]
+
+def complete_user_names(incomplete: str, profile: str = "default") -> list:
+    names = {entry[0] for entry in load_index()["users"].values() if entry[0]}
+    return [(name, None) for name in sorted(names) if _matches(name, incomplete)]
+
+def complete_usernames(incomplete: str, profile: str = "default") -> list:
+    usernames = load_index()["usernames"]
+    ordered = sorted(usernames, key=usernames.get, reverse=True)
+    return [(name, None) for name in ordered if _matches(name, incomplete)]
+
+# Typer autocompletion callbacks for the same arguments, used when the fast
+# path in flavor/__main__.py doesn't apply (e.g. PowerShell)
+def _typer_callback(complete):
+    def callback(incomplete: str):
+        return complete(incomplete, get_active_profile())
+    return callback
+
+autocomplete_project_ids = _typer_callback(complete_project_ids)
+autocomplete_project_titles = _typer_callback(complete_project_titles)
+autocomplete_user_ids = _typer_callback(complete_user_ids)
+autocomplete_user_names = _typer_callback(complete_user_names)
+autocomplete_usernames = _typer_callback(complete_usernames)
+
+# (command path, positional argument index) -> completer
+_DYNAMIC_ARGUMENTS = {
+    (("projects", "view"), 0): complete_project_ids,
+    (("projects", "edit"), 0): complete_project_ids,
+    (("search", "users"), 0): complete_user_names,
+    (("search", "projects"), 0): complete_project_titles,
+    (("login", "id"), 0): complete_user_ids,
+    (("login", "hackatimeuser"), 0): complete_usernames,
+}
+
+def _completion_args(shell: str):
+    """Return (args, incomplete) the same way typer's completion classes do."""
+    if shell == "bash":
+        words = shlex.split(os.environ["COMP_WORDS"])
+        cword = int(os.environ["COMP_CWORD"])
+        incomplete = words[cword] if cword < len(words) else ""
+        return words[1:cword], incomplete
+
+    completion_args = os.environ.get("_TYPER_COMPLETE_ARGS", "")
+    words = shlex.split(completion_args)
+    args = words[1:]
+    if args and not completion_args.endswith(" "):
+        return args[:-1], args[-1]
+    return args, ""
+
+def _resolve(args: list):
+    """Split global options off and return (profile, command path, positional count) or None."""
+    profile = "default"
+    path = []
+    positional = 0
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in _GLOBAL_OPTIONS and not path:
+            if i + 1 >= len(args):
+                return None
+            profile = args[i + 1]
+            i += 2
+            continue
+        if arg.startswith("-"):
+            if arg in _GLOBAL_FLAGS and not path:
+                i += 1
+                continue
+            # Options of the command itself, let typer handle those
+            return None
+        if len(path) < 2:
+            path.append(arg)
+        else:
+            positional += 1
+        i += 1
+    return profile, tuple(path), positional
+
+def _format(shell: str, items: list) -> str:
+    if shell == "bash":
+        return "\n".join(value for value, _ in items)
+    if shell == "zsh":
+        def escape(s):
+            return (s.replace('"', '""').replace("'", "''").replace("$", "\\$")
+                    .replace("`", "\\`").replace(":", r"\\:"))
+        lines = [f'"{escape(v)}":"{escape(h)}"' if h else f'"{escape(v)}"' for v, h in items]
+        return f"_arguments '*: :(({chr(10).join(lines)}))'" if lines else "_files"
+    # fish
+    return "\n".join(f"{v}\t{' '.join(h.split())}" if h else v for v, h in items)
+
+def _maybe_refresh_in_background(profile: str):
+    index = load_index()
+    now = time.time()
+    if now - index["refreshed_at"] < REFRESH_SECONDS or now - index["refresh_started_at"] < REFRESH_COOLDOWN_SECONDS:
+        return
+    index["refresh_started_at"] = now
+    import subprocess
+    try:
+        _save_index(index)
+        subprocess.Popen(
+            [sys.executable, "-m", "flavor.completion", "--refresh", profile],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+def complete_fast() -> bool:
+    """
+    Answer a completion request for a dynamic argument straight from the index.
+    Returns False when the request should go through typer instead.
+    """
+    shell = os.environ.get("_FLAVOR_COMPLETE", "").replace("complete_", "")
+    if shell not in ("bash", "zsh", "fish"):
+        return False
+    try:
+        args, incomplete = _completion_args(shell)
+    except (KeyError, ValueError):
+        return False
+
+    resolved = _resolve(args)
+    if resolved is None:
+        return False
+    profile, path, positional = resolved
+    completer = _DYNAMIC_ARGUMENTS.get((path, positional))
+    if completer is None:
+        return False
+
+    items = completer(incomplete, profile)
+    if shell == "fish" and os.environ.get("_TYPER_COMPLETE_FISH_ACTION") == "is-args":
+        sys.exit(0 if items else 1)
+    output = _format(shell, items)
+    if output:
+        sys.stdout.write(output + "\n")
+    _maybe_refresh_in_background(profile)
+    return True
+
+def _refresh(profile: str):
+    """Fetch your own profile and projects so the index knows about them."""
+    from flavor.config import get_flavor_id, use_profile
+    from flavor.api import get_user_by_id, get_project, APIError
+    from flavor.store import set_refresh
+
+    set_refresh(True)
+    with use_profile(profile):
+        flavor_id = get_flavor_id()
+        if flavor_id and str(flavor_id).isdigit():
+            try:
+                user = get_user_by_id(int(flavor_id))
+                for pid in user.get("project_ids", []):
+                    get_project(pid)
+            except APIError:
+                pass
+    flush(refreshed=True)
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--refresh":
+        _refresh(sys.argv[2])
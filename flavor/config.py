@@ -1,4 +1,6 @@
+import contextvars
 import json
+from contextlib import contextmanager
 from pathlib import Path
 
 # Use a hidden folder in home directory for data storage using a JSON file
@@ -20,38 +22,68 @@ def _save_data(data):
     with open(DATA_FILE, "w") as f:
         json.dump(data, f, indent=4)
 
-def get_api_key() -> str:
+# Credentials live at the top level of data.json for the default profile, and
+# under "profiles" -> <name> for named profiles
+DEFAULT_PROFILE = "default"
+
+_active_profile = DEFAULT_PROFILE
+# Lets worker threads act on behalf of a specific profile (see use_profile)
+_profile_override = contextvars.ContextVar("profile_override", default=None)
+
+def set_active_profile(name: str):
+    global _active_profile
+    _active_profile = name or DEFAULT_PROFILE
+
+def get_active_profile() -> str:
+    return _profile_override.get() or _active_profile
+
+@contextmanager
+def use_profile(name: str):
+    """Temporarily switch profile for the current thread/context."""
+    token = _profile_override.set(name)
+    try:
+        yield
+    finally:
+        _profile_override.reset(token)
+
+def list_profiles() -> list:
     data = _load_data()
-    return data.get("api_key", "")
+    return [DEFAULT_PROFILE] + sorted(data.get("profiles", {}))
 
-def set_api_key(key: str):
+def _profile_data(data: dict) -> dict:
+    profile = get_active_profile()
+    if profile == DEFAULT_PROFILE:
+        return data
+    return data.setdefault("profiles", {}).setdefault(profile, {})
+
+def _get(field: str) -> str:
+    return _profile_data(_load_data()).get(field, "")
+
+def _set(field: str, value: str):
     data = _load_data()
-    data["api_key"] = key
+    _profile_data(data)[field] = value
     _save_data(data)
 
+def get_api_key() -> str:
+    return _get("api_key")
+
+def set_api_key(key: str):
+    _set("api_key", key)
+
 def get_flavor_id() -> str:
-    data = _load_data()
-    return data.get("flavorid", "")
+    return _get("flavorid")
 
 def set_flavor_id(key: str):
-    data = _load_data()
-    data["flavorid"] = key
-    _save_data(data)
+    _set("flavorid", key)
 
 def get_hackatime_key() -> str:
-    data = _load_data()
-    return data.get("hackatime_key", "")
+    return _get("hackatime_key")
 
 def set_hackatime_key(key: str):
-    data = _load_data()
-    data["hackatime_key"] = key
-    _save_data(data)
+    _set("hackatime_key", key)
 
 def get_hackatime_username() -> str:
-    data = _load_data()
-    return data.get("hackatime_username", "")
+    return _get("hackatime_username")
 
 def set_hackatime_username(username: str):
-    data = _load_data()
-    data["hackatime_username"] = username
-    _save_data(data)
+    _set("hackatime_username", username)
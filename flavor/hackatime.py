@@ -1,6 +1,9 @@
 # flavor/hackatime.py
 import requests
+from flavor.completion import remember_username
 from flavor.config import get_hackatime_key
+from flavor import http
+from flavor.store import cached, is_offline
 
 HACKATIME_BASE_URL = "https://hackatime.hackclub.com"
 
@@ -17,9 +20,11 @@ def _get_headers():
 
 def get_time_today():
     # GET /api/hackatime/v1/users/current/statusbar/today
+    if is_offline():
+        raise HackatimeAPIError("Today's coding time is not available in offline mode.")
     url = f"{HACKATIME_BASE_URL}/api/hackatime/v1/users/current/statusbar/today"
     try:
-        response = requests.get(url, headers=_get_headers())
+        response = http.get(url, headers=_get_headers())
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -27,12 +32,15 @@ def get_time_today():
              raise HackatimeAPIError("Invalid API key or unauthorized access.")
         raise HackatimeAPIError(f"Failed to fetch today's time: {str(e)}")
 
-def get_stats(username: str):
-    # GET /api/v1/users/{username}/stats
+@cached(HackatimeAPIError)
+def get_stats(username: str, features: str = None):
+    # GET /api/v1/users/{username}/stats, features=projects adds per-project time
     url = f"{HACKATIME_BASE_URL}/api/v1/users/{username}/stats"
+    params = {"features": features} if features else None
     try:
-        response = requests.get(url, headers=_get_headers())
+        response = http.get(url, headers=_get_headers(), params=params)
         response.raise_for_status()
+        remember_username(username)
         return response.json()
     except requests.RequestException as e:
         if isinstance(e, requests.HTTPError) and e.response.status_code == 401:
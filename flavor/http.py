@@ -0,0 +1,231 @@
+# flavor/http.py
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from flavor.config import DATA_FILE, get_active_profile
+
+# Per-host health shared between runs: recent latencies (for hedging) and
+# circuit breaker state. This would be ~/.flavorlinetool/hosts.json
+HOSTS_FILE = DATA_FILE.parent / "hosts.json"
+
+# Upper bound for a single request, even with plenty of deadline left
+REQUEST_TIMEOUT_SECONDS = 10
+# Default end-to-end budget for one command
+DEFAULT_DEADLINE_SECONDS = 30
+# Hedge delay used until enough latencies are known, and its bounds
+DEFAULT_HEDGE_SECONDS = 1.0
+MIN_HEDGE_SECONDS = 0.2
+MIN_LATENCY_SAMPLES = 5
+MAX_LATENCY_SAMPLES = 50
+# Consecutive failures that open a host's circuit, and how long it stays open
+FAILURE_THRESHOLD = 3
+OPEN_SECONDS = 30
+MAX_OPEN_SECONDS = 300
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without touching the network while a host is known to be failing."""
+
+# One pooled session per profile, so repeated calls (e.g. watch mode or
+# several requests in one command) reuse the same keep-alive connections
+# without sharing them between accounts.
+_sessions = {}
+_session_lock = threading.Lock()
+
+_budget = None
+_deadline = None
+_hosts = None
+_hosts_dirty = False
+_hosts_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    profile = get_active_profile()
+    with _session_lock:
+        session = _sessions.get(profile)
+        if session is None:
+            session = _sessions[profile] = requests.Session()
+        return session
+
+def set_deadline(seconds: float = None):
+    """
+    Give the command's requests `seconds` to finish, or remove the budget
+    (long-running views like --watch only use per-request timeouts). The clock
+    starts with the first request, not while the user is still typing.
+    """
+    global _budget, _deadline
+    _budget = seconds or None
+    _deadline = None
+
+def restart_deadline():
+    """
+    Start the budget over at the next request. Called after waiting on the
+    user (forms, prompts) so the time spent there isn't charged to the network.
+    """
+    global _deadline
+    _deadline = None
+
+def _remaining():
+    """Seconds left in the budget (starting it if needed), or None without one."""
+    global _deadline
+    if _budget is None:
+        return None
+    if _deadline is None:
+        _deadline = time.monotonic() + _budget
+    return _deadline - time.monotonic()
+
+def _timeout() -> float:
+    remaining = _remaining()
+    if remaining is None:
+        return REQUEST_TIMEOUT_SECONDS
+    if remaining <= 0:
+        raise requests.Timeout("Command deadline exceeded.")
+    return min(REQUEST_TIMEOUT_SECONDS, remaining)
+
+def _load_hosts() -> dict:
+    global _hosts
+    if _hosts is None:
+        try:
+            with open(HOSTS_FILE, "r") as f:
+                _hosts = json.load(f)
+        except (OSError, ValueError):
+            _hosts = {}
+    return _hosts
+
+def _save_hosts():
+    global _hosts_dirty
+    with _hosts_lock:
+        if not _hosts_dirty:
+            return
+        data = json.dumps(_hosts)
+        _hosts_dirty = False
+    try:
+        HOSTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = HOSTS_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(data)
+        os.replace(tmp, HOSTS_FILE)
+    except OSError:
+        pass
+
+atexit.register(_save_hosts)
+
+def _host_state(host: str) -> dict:
+    # Callers hold _hosts_lock
+    state = _load_hosts().setdefault(host, {})
+    state.setdefault("latencies", [])
+    state.setdefault("failures", 0)
+    state.setdefault("open_until", 0)
+    state.setdefault("open_seconds", OPEN_SECONDS)
+    return state
+
+def _check_circuit(host: str):
+    with _hosts_lock:
+        state = _host_state(host)
+        if time.time() < state["open_until"]:
+            wait = int(state["open_until"] - time.time()) + 1
+            raise CircuitOpenError(f"{host} is failing, not retrying for another {wait}s.")
+
+def _record_success(host: str, latency: float):
+    global _hosts_dirty
+    with _hosts_lock:
+        state = _host_state(host)
+        state["latencies"] = (state["latencies"] + [round(latency, 3)])[-MAX_LATENCY_SAMPLES:]
+        state["failures"] = 0
+        state["open_until"] = 0
+        state["open_seconds"] = OPEN_SECONDS
+        _hosts_dirty = True
+
+def _record_failure(host: str):
+    global _hosts_dirty
+    with _hosts_lock:
+        state = _host_state(host)
+        state["failures"] += 1
+        if state["failures"] >= FAILURE_THRESHOLD:
+            # A failed probe after the circuit re-opened backs off further
+            if state["open_until"]:
+                state["open_seconds"] = min(state["open_seconds"] * 2, MAX_OPEN_SECONDS)
+            state["open_until"] = time.time() + state["open_seconds"]
+        _hosts_dirty = True
+    # Persist right away so the next run fails fast too
+    _save_hosts()
+
+def _hedge_delay(host: str) -> float:
+    """p95 of recent latencies for the host."""
+    with _hosts_lock:
+        latencies = sorted(_host_state(host)["latencies"])
+    if len(latencies) < MIN_LATENCY_SAMPLES:
+        return DEFAULT_HEDGE_SECONDS
+    return max(latencies[int(len(latencies) * 0.95) - 1], MIN_HEDGE_SECONDS)
+
+def _send(method: str, url: str, host: str, **kwargs) -> requests.Response:
+    timeout = _timeout()
+    started = time.monotonic()
+    try:
+        response = get_session().request(method, url, timeout=timeout, **kwargs)
+    except (requests.ConnectionError, requests.Timeout):
+        _record_failure(host)
+        raise
+    if response.status_code >= 500:
+        _record_failure(host)
+    else:
+        _record_success(host, time.monotonic() - started)
+    return response
+
+def _hedged(url: str, host: str, **kwargs) -> requests.Response:
+    """
+    GET with a backup request: if the first attempt hasn't answered after the
+    host's p95 latency, a second identical request is sent and whichever
+    finishes first successfully wins.
+    """
+    done = threading.Condition()
+    outcomes = []
+
+    def attempt():
+        try:
+            outcome = (_send("GET", url, host, **kwargs), None)
+        except requests.RequestException as e:
+            outcome = (None, e)
+        with done:
+            outcomes.append(outcome)
+            done.notify_all()
+
+    def start():
+        # Attempts run with the caller's context so they use the same profile
+        threading.Thread(target=contextvars.copy_context().run, args=(attempt,), daemon=True).start()
+
+    start()
+    attempts = 1
+    with done:
+        done.wait_for(lambda: outcomes, timeout=_hedge_delay(host))
+        remaining = _remaining()
+        if not outcomes and (remaining is None or remaining > 0):
+            start()
+            attempts = 2
+
+        while True:
+            for response, error in outcomes:
+                if error is None:
+                    return response
+            if len(outcomes) == attempts:
+                raise outcomes[0][1]
+            done.wait()
+
+def _request(method: str, url: str, hedge: bool = False, **kwargs) -> requests.Response:
+    host = urlsplit(url).netloc
+    _check_circuit(host)
+    if hedge:
+        return _hedged(url, host, **kwargs)
+    return _send(method, url, host, **kwargs)
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Idempotent GET, hedged after the host's p95 latency."""
+    return _request("GET", url, hedge=True, **kwargs)
+
+def post(url: str, **kwargs) -> requests.Response:
+    return _request("POST", url, **kwargs)
+
+def patch(url: str, **kwargs) -> requests.Response:
+    return _request("PATCH", url, **kwargs)
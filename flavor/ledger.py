@@ -0,0 +1,193 @@
+# flavor/ledger.py
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from flavor.config import DATA_FILE
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Append-only log of cookie balance observations.
+# This would be ~/.flavorlinetool/cookies.ledger next to data.json
+LEDGER_FILE = DATA_FILE.parent / "cookies.ledger"
+
+# File header, followed by fixed-width records of
+# (unix timestamp as float64, user id as int64, cookies as int64), little endian
+MAGIC = b"FLTLEDG1"
+RECORD = struct.Struct("<dqq")
+
+# Don't record the same balance again if it was observed this recently
+DUPLICATE_WINDOW_SECONDS = 10 * 60
+
+# Balances are recorded from worker threads (and other processes), appends
+# take this lock and an OS lock on the file
+_append_lock = threading.Lock()
+
+class LedgerError(Exception):
+    pass
+
+class _Ledger:
+    """Read-only, memory-mapped view of the ledger records."""
+
+    def __init__(self, mm):
+        self.mm = mm
+        self.count = (len(mm) - len(MAGIC)) // RECORD.size if mm is not None else 0
+
+    def record(self, index: int):
+        return RECORD.unpack_from(self.mm, len(MAGIC) + index * RECORD.size)
+
+    def first_index_at(self, timestamp: float) -> int:
+        """Index of the first record at or after `timestamp` (records are appended in time order)."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.record(mid)[0] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def records(self, start: int = 0):
+        for index in range(start, self.count):
+            yield self.record(index)
+
+@contextmanager
+def _open_ledger():
+    if not LEDGER_FILE.exists() or LEDGER_FILE.stat().st_size <= len(MAGIC):
+        yield _Ledger(None)
+        return
+    with open(LEDGER_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:len(MAGIC)] != MAGIC:
+            raise LedgerError(f"{LEDGER_FILE} is not a cookie ledger.")
+        yield _Ledger(mm)
+
+def _last_for_user(ledger: _Ledger, user_id: int):
+    for index in range(ledger.count - 1, -1, -1):
+        record = ledger.record(index)
+        if record[1] == user_id:
+            return record
+    return None
+
+@contextmanager
+def _locked_for_append():
+    """The ledger opened for appending, locked against other threads and processes."""
+    LEDGER_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with _append_lock, open(LEDGER_FILE, "ab") as f:
+        if os.name == "nt":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield f
+        finally:
+            f.flush()
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def record_balance(user_id: int, cookies: int, timestamp: float = None) -> bool:
+    """
+    Append a balance observation. Returns False if it was skipped because the
+    same balance was recorded for this user within DUPLICATE_WINDOW_SECONDS.
+    """
+    timestamp = time.time() if timestamp is None else timestamp
+
+    with _locked_for_append() as f:
+        with _open_ledger() as ledger:
+            last = _last_for_user(ledger, user_id) if ledger.count else None
+        if last is not None and last[2] == cookies and timestamp - last[0] < DUPLICATE_WINDOW_SECONDS:
+            return False
+
+        size = f.seek(0, os.SEEK_END)
+        if size < len(MAGIC):
+            # A new ledger (or one whose header was cut short)
+            f.truncate(0)
+            f.write(MAGIC)
+        elif (size - len(MAGIC)) % RECORD.size:
+            # A previous write was cut short, drop the partial record
+            f.truncate(size - (size - len(MAGIC)) % RECORD.size)
+        f.write(RECORD.pack(timestamp, user_id, cookies))
+    return True
+
+def history(user_id: int, days: int = 14, today: date = None) -> dict:
+    """
+    Summarize a user's balance history.
+
+    Only the user's first record and the records of the last `days` days are
+    read, so the cost doesn't grow with the age of the ledger. Returns None if
+    the user has no observations.
+    """
+    today = date.today() if today is None else today
+    first_day = today - timedelta(days=days - 1)
+    window_start = datetime.combine(first_day, datetime.min.time()).timestamp()
+
+    with _open_ledger() as ledger:
+        first = None
+        for record in ledger.records():
+            if record[1] == user_id:
+                first = record
+                break
+        if first is None:
+            return None
+
+        # Balance just before the window, to compute the first day's change
+        start = ledger.first_index_at(window_start)
+        before = None
+        for index in range(start - 1, -1, -1):
+            record = ledger.record(index)
+            if record[1] == user_id:
+                before = record
+                break
+
+        closing = {}
+        earned = {}
+        samples = 0
+        last = before
+        for record in ledger.records(start):
+            if record[1] != user_id:
+                continue
+            samples += 1
+            day = date.fromtimestamp(record[0])
+            if last is not None and record[2] > last[2]:
+                earned[day] = earned.get(day, 0) + record[2] - last[2]
+            closing[day] = record[2]
+            last = record
+
+    if last is None:
+        last = first
+
+    daily = []
+    balance = before[2] if before is not None else None
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        change = 0 if balance is not None else None
+        if day in closing:
+            if balance is not None:
+                change = closing[day] - balance
+            balance = closing[day]
+        daily.append({"day": day, "balance": balance, "change": change, "earned": earned.get(day, 0)})
+
+    span_days = (last[0] - first[0]) / 86400
+    tracked_days = min(days, max((time.time() - first[0]) / 86400, 1 / 24))
+    window_earned = sum(earned.values())
+
+    return {
+        "first_seen": first[0],
+        "last_seen": last[0],
+        "balance": last[2],
+        "all_time_change": last[2] - first[2],
+        "all_time_rate": (last[2] - first[2]) / span_days if span_days > 0 else None,
+        "window_samples": samples,
+        "window_earned": window_earned,
+        "window_rate": window_earned / tracked_days,
+        "daily": daily,
+    }
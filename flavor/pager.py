@@ -0,0 +1,195 @@
+# flavor/pager.py
+import threading
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+from flavor.http import set_deadline
+from flavor.tui import raw_terminal, read_key
+
+# Lines used by the title, header, borders and footer around the rows
+_CHROME_LINES = 7
+# Start fetching the next page when the view gets this close to the end of what's loaded
+_LOOKAHEAD_ROWS = 10
+
+class Pager:
+    """
+    Scrollable table over a paginated endpoint.
+
+    Only the rows in the visible window are laid out on each redraw, and pages
+    are fetched on demand (in the background) as the view approaches them, so
+    layout cost depends on the terminal height and memory on how far the user
+    has scrolled, not on the size of the whole result set.
+
+    `fetch_page(page)` returns `(items, total_pages, total_count)`, where the
+    totals may be None if unknown. `format_row(item)` returns the cells of a row.
+    """
+
+    def __init__(self, title: str, columns: list, fetch_page, format_row, console: Console = None):
+        self.title = title
+        self.columns = columns
+        self.fetch_page = fetch_page
+        self.format_row = format_row
+        self.console = console or Console()
+
+        self.pages = {}
+        self.page_size = None
+        self.total_pages = None
+        self.total_count = None
+        self.loading = set()
+        self.error = None
+        self.cursor = 0
+        self.offset = 0
+        self.lock = threading.Lock()
+        self.changed = threading.Event()
+
+    def _page_size_from(self, page: int, items: list):
+        """The page size, if `page` tells us: the last page may be shorter than the rest."""
+        if self.total_pages is None or page == self.total_pages:
+            if page == 1:
+                return max(len(items), 1)
+            if page == self.total_pages and self.total_count is not None:
+                return max((self.total_count - len(items)) // (page - 1), 1)
+            return None
+        return max(len(items), 1) if page < self.total_pages else None
+
+    def _store_page(self, page: int, result):
+        items, total_pages, total_count = result
+        with self.lock:
+            self.pages[page] = items
+            if isinstance(total_pages, int):
+                self.total_pages = total_pages
+            if isinstance(total_count, int):
+                self.total_count = total_count
+            if not items and (self.total_pages is None or page < self.total_pages):
+                # An empty page means we walked past the end
+                self.total_pages = page - 1
+            elif self.page_size is None:
+                self.page_size = self._page_size_from(page, items)
+
+    def _load(self, page: int):
+        try:
+            result = self.fetch_page(page)
+        except Exception as e:
+            with self.lock:
+                self.error = str(e)
+                self.loading.discard(page)
+            self.changed.set()
+            return
+        self._store_page(page, result)
+        with self.lock:
+            self.loading.discard(page)
+        self.changed.set()
+
+    def _count(self) -> int:
+        """Number of rows we know about so far."""
+        if self.total_count is not None:
+            return self.total_count
+        if self.total_pages is not None and self.total_pages in self.pages:
+            return (self.total_pages - 1) * self.page_size + len(self.pages[self.total_pages])
+        if not self.pages:
+            return 0
+        last = max(self.pages)
+        return (last - 1) * self.page_size + len(self.pages[last])
+
+    def _item(self, index: int):
+        page = index // self.page_size + 1
+        items = self.pages.get(page)
+        if items is None or index % self.page_size >= len(items):
+            return None
+        return items[index % self.page_size]
+
+    def _request_pages(self, first: int, last: int):
+        """Start background fetches for any page covering rows first..last."""
+        for page in range(first // self.page_size + 1, last // self.page_size + 2):
+            if self.total_pages is not None and page > self.total_pages:
+                break
+            if page in self.pages or page in self.loading or self.error:
+                continue
+            self.loading.add(page)
+            threading.Thread(target=self._load, args=(page,), daemon=True).start()
+
+    def _visible_rows(self) -> int:
+        return max(self.console.height - _CHROME_LINES, 3)
+
+    def _render(self):
+        height = self._visible_rows()
+        with self.lock:
+            count = self._count()
+            self.cursor = max(0, min(self.cursor, max(count - 1, 0)))
+            if self.cursor < self.offset:
+                self.offset = self.cursor
+            elif self.cursor >= self.offset + height:
+                self.offset = self.cursor - height + 1
+            self._request_pages(self.offset, self.offset + height + _LOOKAHEAD_ROWS)
+
+            table = Table(title=self.title, expand=True)
+            for name, options in self.columns:
+                table.add_column(name, **{"no_wrap": True, "overflow": "ellipsis", **options})
+
+            for index in range(self.offset, min(self.offset + height, count)):
+                item = self._item(index)
+                style = "reverse" if index == self.cursor else None
+                if item is None:
+                    table.add_row(*["…"] * len(self.columns), style=style)
+                else:
+                    table.add_row(*self.format_row(item), style=style)
+
+            status = f"Rows {self.offset + 1 if count else 0}-{min(self.offset + height, count)} of {count}"
+            if self.total_count is None and (self.total_pages is None or self.total_pages not in self.pages):
+                status += "+"
+            if self.loading:
+                status += " • loading..."
+            if self.error:
+                status += f" • Error: {self.error}"
+        footer = Text(f"{status}  •  ↑/↓ PgUp/PgDn Home/End to scroll  •  q to quit", style="dim")
+        return Group(table, footer)
+
+    def load(self, start_page: int = 1):
+        """Fetch the page to start on, errors are raised to the caller."""
+        self._store_page(start_page, self.fetch_page(start_page))
+        if self.page_size is None and start_page != 1:
+            # Starting on what may be a short last page, the first page has the real size
+            self._store_page(1, self.fetch_page(1))
+        if self.page_size is None:
+            # Every page we loaded was empty, there is nothing to lay out
+            self.page_size = 1
+        self.cursor = self.offset = (start_page - 1) * self.page_size
+
+    def run(self):
+        """Show the pager until the user quits."""
+        if not self.pages:
+            self.load()
+        # Pages are fetched for as long as the user keeps scrolling
+        set_deadline(None)
+
+        with raw_terminal(), Live(self._render(), console=self.console, auto_refresh=False, transient=True) as live:
+            while True:
+                try:
+                    key = read_key(timeout=0.1)
+                except KeyboardInterrupt:
+                    return
+
+                height = self._visible_rows()
+                if key in ("q", "escape"):
+                    return
+                elif key in ("down", "j"):
+                    self.cursor += 1
+                elif key in ("up", "k"):
+                    self.cursor -= 1
+                elif key in ("pagedown", " "):
+                    self.cursor += height
+                    self.offset += height
+                elif key == "pageup":
+                    self.cursor -= height
+                    self.offset = max(self.offset - height, 0)
+                elif key in ("home", "g"):
+                    self.cursor = 0
+                elif key in ("end", "G"):
+                    with self.lock:
+                        self.cursor = self._count() - 1
+                elif key is None and not self.changed.is_set():
+                    continue
+
+                self.changed.clear()
+                live.update(self._render(), refresh=True)
@@ -0,0 +1,167 @@
+# flavor/planner.py
+#
+# Picks the best basket of shop items for a cookie budget. This is a bounded
+# knapsack problem: each item has a cost, a value and a maximum quantity.
+import functools
+import math
+import time
+
+# Above this many DP cells (pieces x reduced budget) branch and bound is used instead
+MAX_DP_CELLS = 3_000_000
+# Branch and bound gives up (keeping the best basket found so far) after this long
+SEARCH_SECONDS = 2.0
+
+class Choice:
+    """One shop item as far as the solver is concerned."""
+
+    def __init__(self, key, cost: int, value: float, limit: int):
+        self.key = key
+        self.cost = cost
+        self.value = value
+        self.limit = limit
+
+def _pieces(choices: list) -> list:
+    """
+    Split every item into 0/1 pieces of 1, 2, 4, ... copies (binary
+    splitting), so any quantity up to its limit is a subset of its pieces
+    while there are only O(log limit) of them.
+    """
+    pieces = []
+    for index, choice in enumerate(choices):
+        remaining, size = choice.limit, 1
+        while remaining > 0:
+            take = min(size, remaining)
+            pieces.append((choice.cost * take, choice.value * take, index, take))
+            remaining -= take
+            size *= 2
+    return pieces
+
+def _solve_dp(pieces: list, capacity: int):
+    """Exact 0/1 knapsack over the pieces. Returns the chosen piece indices."""
+    best = [0.0] * (capacity + 1)
+    taken = []
+    for cost, value, _, _ in pieces:
+        if cost > capacity:
+            taken.append(None)
+            continue
+        # With the piece: best value at c - cost, plus this piece. Computed
+        # from the previous row all at once, which is what makes it 0/1.
+        with_piece = [b + value for b in best[:capacity + 1 - cost]]
+        without = best[cost:]
+        taken.append(bytearray(cost) + bytearray(w > b for w, b in zip(with_piece, without)))
+        best = best[:cost] + [w if w > b else b for w, b in zip(with_piece, without)]
+
+    # The cheapest capacity reaching the best value, so ties spend less
+    top = best[capacity]
+    c = next(c for c in range(capacity + 1) if best[c] >= top - 1e-9)
+    chosen = []
+    for index in range(len(pieces) - 1, -1, -1):
+        row = taken[index]
+        if row is not None and row[c]:
+            chosen.append(index)
+            c -= pieces[index][0]
+    return chosen
+
+def _solve_branch_and_bound(pieces: list, capacity: int):
+    """
+    Depth-first branch and bound over the pieces sorted by value per cookie,
+    pruned with the fractional (LP relaxation) bound.
+    Returns (chosen piece indices, whether the search finished).
+    """
+    order = sorted(range(len(pieces)), key=lambda i: pieces[i][1] / pieces[i][0], reverse=True)
+    costs = [pieces[i][0] for i in order]
+    values = [pieces[i][1] for i in order]
+    count = len(order)
+    deadline = time.monotonic() + SEARCH_SECONDS
+
+    def bound(position: int, room: int, value: float) -> float:
+        for i in range(position, count):
+            if costs[i] <= room:
+                room -= costs[i]
+                value += values[i]
+            else:
+                return value + values[i] * room / costs[i]
+        return value
+
+    best_value, best_set = 0.0, []
+    # (position, room left, value so far, chosen so far)
+    stack = [(0, capacity, 0.0, [])]
+    finished = True
+    steps = 0
+    while stack:
+        position, room, value, chosen = stack.pop()
+        if value > best_value:
+            best_value, best_set = value, chosen
+        if position == count or bound(position, room, value) <= best_value + 1e-9:
+            continue
+        steps += 1
+        if steps % 1024 == 0 and time.monotonic() > deadline:
+            finished = False
+            break
+        # Push "skip" first so "take" (the greedy choice) is explored first
+        stack.append((position + 1, room, value, chosen))
+        if costs[position] <= room:
+            stack.append((position + 1, room - costs[position], value + values[position], chosen + [position]))
+    return [order[i] for i in best_set], finished
+
+def _solve_greedy(choices: list, budget: int) -> dict:
+    """
+    When every item is worth the same, taking the cheapest copies first is
+    optimal (and of the baskets with the most items, spends the least).
+    """
+    quantities = {}
+    for choice in sorted(choices, key=lambda c: c.cost):
+        take = min(choice.limit, budget // choice.cost)
+        if take <= 0:
+            break
+        quantities[choice.key] = take
+        budget -= choice.cost * take
+    return quantities
+
+def plan(choices: list, budget: int) -> dict:
+    """
+    Choose quantities for `choices` (a list of Choice) that maximize the total
+    value without spending more than `budget`.
+
+    Returns {"quantities": {key: quantity}, "cost", "value", "optimal", "method"}.
+    """
+    usable = [c for c in choices if c.limit > 0 and c.value > 0 and c.cost <= budget]
+    quantities = {}
+    # Free items can't make anything else unaffordable
+    for choice in usable:
+        if choice.cost <= 0:
+            quantities[choice.key] = choice.limit
+    usable = [c for c in usable if c.cost > 0]
+
+    optimal, method = True, "dp"
+    if usable and len({c.value for c in usable}) == 1:
+        # The default goal, every item counts as one
+        method = "greedy"
+        quantities.update(_solve_greedy(usable, budget))
+    elif usable:
+        # Costs that all share a factor (e.g. every price a multiple of 5) shrink the table
+        divisor = functools.reduce(math.gcd, [c.cost for c in usable])
+        capacity = budget // divisor
+        pieces = _pieces([
+            Choice(c.key, c.cost // divisor, c.value, min(c.limit, capacity // (c.cost // divisor)))
+            for c in usable
+        ])
+
+        if len(pieces) * (capacity + 1) <= MAX_DP_CELLS:
+            chosen = _solve_dp(pieces, capacity)
+        else:
+            method = "branch and bound"
+            chosen, optimal = _solve_branch_and_bound(pieces, capacity)
+
+        for index in chosen:
+            key = usable[pieces[index][2]].key
+            quantities[key] = quantities.get(key, 0) + pieces[index][3]
+
+    by_key = {c.key: c for c in choices}
+    return {
+        "quantities": quantities,
+        "cost": sum(by_key[k].cost * q for k, q in quantities.items()),
+        "value": sum(by_key[k].value * q for k, q in quantities.items()),
+        "optimal": optimal,
+        "method": method,
+    }
@@ -0,0 +1,87 @@
+# flavor/prefetch.py
+#
+# Detached workers that fill the response store in the background.
+#
+# Opt-in prefetching of what you're likely to ask for next: after a listing is
+# shown, a worker fetches the next page (and the details of the projects just
+# listed), so running the same command with --page N+1 or opening one of the
+# projects is answered from disk instead of waiting on the API.
+#
+# The store also starts one at exit to refresh the stale responses it served.
+import importlib
+import json
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from flavor.config import get_active_profile
+from flavor.store import is_offline
+
+# Parallel requests made by one prefetch worker
+MAX_WORKERS = 4
+
+def prefetch_in_background(endpoint: str, page: int = None, query: str = None, project_ids=()):
+    """
+    Start a worker that warms the store for `endpoint` ("users" or "projects")
+    at `page`, plus the given project details. Never waits for it.
+    """
+    if is_offline():
+        return
+    spec = {"endpoint": endpoint, "page": page, "query": query, "project_ids": list(project_ids)}
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "flavor.prefetch", get_active_profile(), json.dumps(spec)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        # Prefetching is only an optimization
+        pass
+
+def _prefetch(profile: str, spec: dict):
+    from flavor.api import get_users, get_projects, get_project, APIError
+    from flavor.config import use_profile
+
+    fetch = {"users": get_users, "projects": get_projects}.get(spec.get("endpoint"))
+    calls = []
+    if fetch is not None and spec.get("page"):
+        calls.append(lambda: fetch(page=spec["page"], query=spec.get("query")))
+    for pid in spec.get("project_ids") or []:
+        calls.append(lambda pid=pid: get_project(pid))
+
+    def run(call):
+        # Each thread enters the profile itself, the override is per context
+        with use_profile(profile):
+            try:
+                call()
+            except APIError:
+                pass
+
+    # Going through the cached API functions means anything already fresh in
+    # the store isn't fetched again, and everything fetched is saved there
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        list(pool.map(run, calls))
+
+def _revalidate(calls: list):
+    """Fetch responses live and store them, see store._start_revalidation."""
+    from flavor.config import use_profile
+    from flavor.store import set_refresh
+
+    set_refresh(True)
+
+    def run(call):
+        profile, module, name, arguments = call
+        with use_profile(profile):
+            try:
+                getattr(importlib.import_module(module), name)(**json.loads(arguments))
+            except Exception:
+                # The next run will try again
+                pass
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        list(pool.map(run, calls))
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--revalidate"]:
+        _revalidate(json.loads(sys.stdin.read() or "[]"))
+    elif len(sys.argv) == 3:
+        _prefetch(sys.argv[1], json.loads(sys.argv[2]))
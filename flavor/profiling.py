@@ -0,0 +1,149 @@
+# flavor/profiling.py
+#
+# CPU and memory profiling of a whole command, for pinning down slow or
+# memory hungry code paths in real runs ('flavor --profiler cpu ...').
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from rich.console import Console
+from rich.table import Table
+from flavor.config import DATA_FILE
+
+# This would be ~/.flavorlinetool/profiles/ next to data.json
+PROFILES_DIR = DATA_FILE.parent / "profiles"
+MODES = ("cpu", "mem")
+
+# How often the stack sampler looks at every thread
+SAMPLE_SECONDS = 0.005
+# Frames kept per allocation traceback in memory mode
+MEMORY_FRAMES = 25
+
+# Profiles go to stderr so they don't mix with the command's own output
+console = Console(stderr=True)
+
+def _frame_name(filename: str, lineno: int, function: str) -> str:
+    return f"{function} ({os.path.basename(filename)}:{lineno})"
+
+def _output_path(name: str, suffix: str):
+    PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+    return PROFILES_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}-{name}{suffix}"
+
+def _write_folded(path, stacks: Counter):
+    """Collapsed stacks ("outer;inner;leaf count" per line), as used by flamegraph tools."""
+    with open(path, "w") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{';'.join(stack)} {count}\n")
+
+class _StackSampler:
+    """
+    Samples the stacks of every thread at a fixed interval. cProfile only sees
+    the thread that enabled it, while commands do much of their work in
+    worker threads, so the collapsed stacks come from here.
+    """
+
+    def __init__(self):
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="profiler sampler", daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self.stopped.wait(SAMPLE_SECONDS):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(_frame_name(code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+def _start_cpu(name: str, top: int):
+    profile = cProfile.Profile()
+    sampler = _StackSampler()
+    sampler.start()
+    profile.enable()
+
+    def stop():
+        profile.disable()
+        sampler.stop()
+        stats_path = _output_path(name, ".pstats")
+        profile.dump_stats(stats_path)
+        folded_path = stats_path.with_suffix(".folded")
+        _write_folded(folded_path, sampler.stacks)
+
+        stats = pstats.Stats(profile).sort_stats("tottime")
+        table = Table(title=f"Top {top} functions by own time (main thread)")
+        table.add_column("Function", style="cyan")
+        table.add_column("Calls", justify="right")
+        table.add_column("Own (ms)", justify="right", style="green")
+        table.add_column("Total (ms)", justify="right", style="yellow")
+        for func in stats.fcn_list[:top]:
+            _, calls, own, total, _ = stats.stats[func]
+            table.add_row(_frame_name(*func), str(calls), f"{own * 1000:.1f}", f"{total * 1000:.1f}")
+        console.print(table)
+        console.print(f"[dim]Wrote {stats_path} and {folded_path}[/dim]")
+    return stop
+
+def _start_mem(name: str, top: int):
+    tracemalloc.start(MEMORY_FRAMES)
+
+    def stop():
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ])
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        snapshot_path = _output_path(name, ".tracemalloc")
+        snapshot.dump(str(snapshot_path))
+        # Collapsed stacks weighted by bytes still allocated at exit
+        stacks = Counter()
+        for stat in snapshot.statistics("traceback"):
+            frames = tuple(f"{os.path.basename(f.filename)}:{f.lineno}" for f in stat.traceback)
+            stacks[frames] += stat.size
+        folded_path = snapshot_path.with_suffix(".folded")
+        _write_folded(folded_path, stacks)
+
+        table = Table(title=f"Top {top} allocation sites (still allocated at exit)")
+        table.add_column("Location", style="cyan")
+        table.add_column("Blocks", justify="right")
+        table.add_column("Size (KB)", justify="right", style="green")
+        for stat in snapshot.statistics("lineno")[:top]:
+            frame = stat.traceback[0]
+            location = "/".join(frame.filename.replace(os.sep, "/").split("/")[-2:])
+            table.add_row(f"{location}:{frame.lineno}", str(stat.count), f"{stat.size / 1024:.1f}")
+        console.print(table)
+        console.print(f"[dim]Peak traced memory {peak / 1024:.0f} KB, {current / 1024:.0f} KB at exit.[/dim]")
+        console.print(f"[dim]Wrote {snapshot_path} and {folded_path}[/dim]")
+    return stop
+
+def start(mode: str, name: str, top: int = 15):
+    """
+    Start profiling the rest of the command. Returns a function that stops
+    the profiler, writes its files under PROFILES_DIR and prints the top
+    `top` entries.
+    """
+    stop = _start_cpu(name, top) if mode == "cpu" else _start_mem(name, top)
+
+    def finish():
+        try:
+            stop()
+        except OSError as e:
+            console.print(f"Could not write the profile: {e}", style="bold red")
+    return finish
@@ -0,0 +1,359 @@
+# flavor/store.py
+import atexit
+import functools
+import gzip
+import hashlib
+import inspect
+import json
+import shutil
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import requests
+from flavor.config import DATA_FILE, get_active_profile
+
+# Last known API responses, used for offline mode and stale-while-revalidate.
+#
+# Payloads are stored once per distinct content (keyed by their SHA-256) and
+# compressed, while a separate index maps each endpoint + params key to the
+# payload it last returned. Pages that keep returning the same JSON therefore
+# cost one row in the index, not another copy of the data.
+# This would be ~/.flavorlinetool/store.db next to data.json
+STORE_FILE = DATA_FILE.parent / "store.db"
+# Where the previous one-file-per-response store lived
+LEGACY_STORE_DIR = DATA_FILE.parent / "responses"
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Cached responses younger than this are served without revalidating
+FRESH_SECONDS = 60
+# Cached responses older than this are only served offline or as a fallback
+MAX_STALE_SECONDS = 7 * 24 * 60 * 60
+
+_offline = False
+_refresh = False
+_served_stale = []
+# Stale entries to refresh once the command is done, as (profile, module, name, arguments)
+_revalidating = {}
+_lock = threading.Lock()
+
+def set_offline(offline: bool):
+    global _offline
+    _offline = offline
+
+def is_offline() -> bool:
+    return _offline
+
+def set_refresh(refresh: bool):
+    """Always fetch from the API instead of serving cached responses first."""
+    global _refresh
+    _refresh = refresh
+
+def is_refresh() -> bool:
+    return _refresh
+
+class StoreError(OSError):
+    """The response store couldn't be read or written."""
+
+_local = threading.local()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    hash TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    hash TEXT NOT NULL REFERENCES objects(hash),
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_endpoint ON entries(endpoint);
+CREATE INDEX IF NOT EXISTS entries_hash ON entries(hash);
+"""
+
+def _connect() -> sqlite3.Connection:
+    """One connection per thread, the database handles locking between processes."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        STORE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(STORE_FILE, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+        if LEGACY_STORE_DIR.exists():
+            shutil.rmtree(LEGACY_STORE_DIR, ignore_errors=True)
+    return conn
+
+def _compress(raw: bytes):
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=10).compress(raw)
+    return "gzip", gzip.compress(raw, compresslevel=6)
+
+def _decompress(codec: str, blob: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise StoreError("zstandard is needed to read this entry.")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return gzip.decompress(blob)
+
+def _split_key(key: str):
+    endpoint, _, params = key.partition(":")
+    return endpoint, params
+
+def load(key: str):
+    """Return (stored_at, data) for a key, or None if nothing is stored."""
+    try:
+        row = _connect().execute(
+            "SELECT e.stored_at, o.codec, o.data FROM entries e JOIN objects o ON o.hash = e.hash WHERE e.key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        stored_at, codec, blob = row
+        return stored_at, json.loads(_decompress(codec, blob))
+    except (sqlite3.Error, StoreError, OSError, ValueError):
+        return None
+
+def save(key: str, data):
+    raw = json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+    digest = hashlib.sha256(raw).hexdigest()
+    endpoint, params = _split_key(key)
+    try:
+        conn = _connect()
+        with conn:
+            exists = conn.execute("SELECT 1 FROM objects WHERE hash = ?", (digest,)).fetchone()
+            if not exists:
+                codec, blob = _compress(raw)
+                conn.execute(
+                    "INSERT OR IGNORE INTO objects (hash, codec, size, data) VALUES (?, ?, ?, ?)",
+                    (digest, codec, len(raw), blob),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, endpoint, params, hash, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, params, digest, time.time()),
+            )
+    except sqlite3.Error as e:
+        raise StoreError(f"Could not write to {STORE_FILE}: {e}")
+
+def forget(key: str):
+    try:
+        conn = _connect()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+    except sqlite3.Error:
+        pass
+
+def stats() -> dict:
+    """Summary of what the store holds, for 'flavor cache stats'."""
+    try:
+        conn = _connect()
+        entries, oldest, newest = conn.execute(
+            "SELECT COUNT(*), MIN(stored_at), MAX(stored_at) FROM entries"
+        ).fetchone()
+        objects, raw_size, stored_size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM objects"
+        ).fetchone()
+        # What the entries would take if every one kept its own uncompressed copy
+        logical_size = conn.execute(
+            "SELECT COALESCE(SUM(o.size), 0) FROM entries e JOIN objects o ON o.hash = e.hash"
+        ).fetchone()[0]
+        endpoints = conn.execute(
+            "SELECT e.endpoint, COUNT(*), COUNT(DISTINCT e.hash), MAX(e.stored_at) "
+            "FROM entries e GROUP BY e.endpoint ORDER BY COUNT(*) DESC"
+        ).fetchall()
+    except sqlite3.Error as e:
+        raise StoreError(f"Could not read {STORE_FILE}: {e}")
+
+    files = [STORE_FILE, STORE_FILE.with_name(STORE_FILE.name + "-wal")]
+    return {
+        "entries": entries,
+        "objects": objects,
+        "oldest": oldest,
+        "newest": newest,
+        "logical_size": logical_size,
+        "raw_size": raw_size,
+        "stored_size": stored_size,
+        "file_size": sum(f.stat().st_size for f in files if f.exists()),
+        "codec": "zstd" if zstandard is not None else "gzip",
+        "endpoints": endpoints,
+    }
+
+def prune(older_than_seconds: float = None, endpoint: str = None) -> tuple:
+    """
+    Drop entries (all of them, or those older than the given age and/or for
+    one endpoint), then any payload no entry refers to anymore.
+    Returns (entries removed, objects removed).
+    """
+    conditions, params = [], []
+    if older_than_seconds is not None:
+        conditions.append("stored_at < ?")
+        params.append(time.time() - older_than_seconds)
+    if endpoint is not None:
+        conditions.append("endpoint LIKE ?")
+        params.append(f"%{endpoint}%")
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    try:
+        conn = _connect()
+        with conn:
+            entries = conn.execute(f"DELETE FROM entries{where}", params).rowcount
+            objects = conn.execute(
+                "DELETE FROM objects WHERE hash NOT IN (SELECT hash FROM entries)"
+            ).rowcount
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error as e:
+        raise StoreError(f"Could not prune {STORE_FILE}: {e}")
+    return entries, objects
+
+def _save_quietly(key: str, data):
+    # A full disk or read-only home shouldn't break a command that already has its data
+    try:
+        save(key, data)
+    except OSError:
+        pass
+
+def _note_stale(stored_at: float, reason: str):
+    with _lock:
+        _served_stale.append((stored_at, reason))
+
+def format_age(seconds: float) -> str:
+    seconds = max(int(seconds), 0)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
+
+def staleness_note():
+    """
+    Describe the oldest cached response shown during this run.
+    Returns None when everything came straight from the API.
+    """
+    with _lock:
+        if not _served_stale:
+            return None
+        oldest = min(stored_at for stored_at, _ in _served_stale)
+        reasons = {reason for _, reason in _served_stale}
+    age = format_age(time.time() - oldest)
+    if "offline" in reasons:
+        return f"[dim yellow]⚠ Offline: showing cached data from {age} ago.[/dim yellow]"
+    if "unreachable" in reasons:
+        return f"[dim yellow]⚠ API unreachable: showing cached data from {age} ago.[/dim yellow]"
+    return f"[dim yellow]⚠ Showing cached data from {age} ago, refreshing in the background.[/dim yellow]"
+
+def print_staleness(console):
+    """Print the staleness note, if any, at the end of a command's output."""
+    note = staleness_note()
+    if note:
+        console.print(note)
+
+def _is_unreachable(error: Exception) -> bool:
+    # API errors are raised while handling the underlying requests exception
+    cause = error.__cause__ or error.__context__
+    return isinstance(cause, (requests.ConnectionError, requests.Timeout))
+
+def _revalidate(key: str, func, arguments: str):
+    with _lock:
+        if key in _revalidating:
+            return
+        if not _revalidating:
+            atexit.register(_start_revalidation)
+        _revalidating[key] = (get_active_profile(), func.__module__, func.__name__, arguments)
+
+def _start_revalidation():
+    """
+    Hand every stale entry served during this run to one detached worker, so
+    the command (and the shell prompt) doesn't wait on the requests. The
+    worker calls the public, decorated functions so the refreshed responses
+    go through the same layers, sharing its connections and thread pool.
+    """
+    with _lock:
+        calls = list(_revalidating.values())
+    if not calls:
+        return
+    try:
+        worker = subprocess.Popen(
+            [sys.executable, "-m", "flavor.prefetch", "--revalidate"],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        # Passed on stdin, a long run can leave more than fits on a command line
+        worker.stdin.write(json.dumps(calls).encode())
+        worker.stdin.close()
+    except OSError:
+        # The next run will try again
+        pass
+
+def cached(error_cls, on_fetched=None):
+    """
+    Serve a read-only API call from the local response store.
+
+    Offline, the last stored response is returned (or `error_cls` is raised if
+    there is none). Online, a fresh response is returned as-is, a stale one is
+    returned immediately while a background worker refreshes it, and anything
+    older than MAX_STALE_SECONDS is fetched synchronously. If the API cannot be
+    reached, the last stored response is used as a fallback.
+
+    `on_fetched(data, *args, **kwargs)` is called for every response that
+    came live from the API, including ones fetched by the revalidation worker.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def make_arguments(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return json.dumps(bound.arguments, sort_keys=True, default=str)
+
+        def make_key(*args, **kwargs):
+            # Each profile gets its own partition of the store
+            return f"{get_active_profile()}/{func.__module__}.{func.__name__}:{make_arguments(*args, **kwargs)}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(*args, **kwargs)
+            entry = load(key)
+
+            if _offline:
+                if entry is None:
+                    raise error_cls(f"No cached data for {func.__name__.replace('_', ' ')} (offline mode).")
+                _note_stale(entry[0], "offline")
+                return entry[1]
+
+            if entry is not None and not _refresh:
+                stored_at, data = entry
+                age = time.time() - stored_at
+                if age < FRESH_SECONDS:
+                    return data
+                if age < MAX_STALE_SECONDS:
+                    _note_stale(stored_at, "revalidating")
+                    _revalidate(key, func, make_arguments(*args, **kwargs))
+                    return data
+
+            try:
+                data = func(*args, **kwargs)
+            except error_cls as e:
+                if entry is not None and _is_unreachable(e):
+                    _note_stale(entry[0], "unreachable")
+                    return entry[1]
+                raise
+            _save_quietly(key, data)
+            if on_fetched is not None:
+                on_fetched(data, *args, **kwargs)
+            return data
+
+        wrapper.forget = lambda *args, **kwargs: forget(make_key(*args, **kwargs))
+        return wrapper
+    return decorator
@@ -0,0 +1,60 @@
+# flavor/tables.py
+#
+# Columns and row formatting shared by the listings in 'list' and 'search',
+# both for plain tables and for the pager.
+from rich.table import Table
+
+USER_COLUMNS = [
+    ("ID", {"justify": "right", "style": "cyan", "no_wrap": True}),
+    ("Display Name", {"style": "magenta"}),
+    ("Slack ID", {"style": "green"}),
+    ("Cookies", {"justify": "right", "style": "yellow"}),
+]
+
+PROJECT_COLUMNS = [
+    ("ID", {"justify": "right", "style": "cyan", "no_wrap": True}),
+    ("Title", {"style": "magenta"}),
+    ("Description", {"style": "white"}),
+    ("Repo URL", {"style": "blue"}),
+]
+
+SHOP_COLUMNS = [
+    ("ID", {"justify": "right", "style": "cyan", "no_wrap": True}),
+    ("Name", {"style": "magenta"}),
+    ("Cost", {"justify": "right", "style": "green"}),
+    ("Stock", {"justify": "right", "style": "yellow"}),
+    ("Limited", {"justify": "center", "style": "red"}),
+]
+
+def make_table(title: str, columns: list) -> Table:
+    table = Table(title=title)
+    for name, options in columns:
+        table.add_column(name, **options)
+    return table
+
+def user_row(user: dict) -> tuple:
+    d_name = user.get("display_name") or "Unknown"
+    s_id = user.get("slack_id") or "N/A"
+    c_count = str(user.get("cookies") if user.get("cookies") is not None else 0)
+    return str(user.get("id")), d_name, s_id, c_count
+
+def project_row(project: dict) -> tuple:
+    p_id = str(project.get("id"))
+    title = project.get("title") or "Unknown"
+    desc = project.get("description") or "-"
+    if len(desc) > 50:
+        desc = desc[:47] + "..."
+    repo = project.get("repo_url") or "-"
+    return p_id, title, desc, repo
+
+def shop_row(item: dict) -> tuple:
+    i_id = str(item.get("id"))
+    name = item.get("name") or "Unknown"
+
+    ticket_cost = item.get("ticket_cost", {})
+    cost = str(ticket_cost.get("base_cost") if ticket_cost else "N/A")
+
+    stock = str(item.get("stock")) if item.get("stock") is not None else "∞"
+
+    is_limited = "Yes" if item.get("limited") else "No"
+    return i_id, name, cost, stock, is_limited
@@ -0,0 +1,119 @@
+# flavor/tui.py
+import codecs
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Minimal keyboard handling for the interactive views.
+# Keys are returned as plain characters, or as one of the names below for
+# special keys: "up", "down", "left", "right", "pageup", "pagedown",
+# "home", "end", "enter", "backspace", "escape", "tab".
+
+if os.name == "nt":
+    import msvcrt
+
+    _WIN_KEYS = {
+        "H": "up", "P": "down", "K": "left", "M": "right",
+        "I": "pageup", "Q": "pagedown", "G": "home", "O": "end",
+    }
+
+    @contextmanager
+    def raw_terminal():
+        # The Windows console already delivers keys unbuffered via msvcrt
+        yield
+
+    def read_key(timeout: float = None):
+        """Wait up to `timeout` seconds for a key press, returns None on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+
+        ch = msvcrt.getwch()
+        if ch in ("\x00", "\xe0"):
+            return _WIN_KEYS.get(msvcrt.getwch())
+        if ch == "\r":
+            return "enter"
+        if ch == "\x08":
+            return "backspace"
+        if ch == "\x1b":
+            return "escape"
+        if ch == "\t":
+            return "tab"
+        if ch == "\x03":
+            raise KeyboardInterrupt
+        return ch
+else:
+    import select
+    import termios
+    import tty
+
+    _ESCAPE_KEYS = {
+        "[A": "up", "[B": "down", "[C": "right", "[D": "left",
+        "[5~": "pageup", "[6~": "pagedown",
+        "[H": "home", "[F": "end", "[1~": "home", "[4~": "end",
+        "OH": "home", "OF": "end",
+    }
+
+    @contextmanager
+    def raw_terminal():
+        """Put stdin in cbreak mode (no echo, no line buffering) for the duration."""
+        fd = sys.stdin.fileno()
+        old = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+    # Bytes of a multi-byte UTF-8 character arrive one read at a time
+    _decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+    def _read_char(fd, timeout):
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return None
+        while True:
+            ch = _decoder.decode(os.read(fd, 1))
+            if ch:
+                return ch
+            # The rest of the character is already on its way
+            ready, _, _ = select.select([fd], [], [], 0.05)
+            if not ready:
+                _decoder.reset()
+                return None
+
+    def read_key(timeout: float = None):
+        """Wait up to `timeout` seconds for a key press, returns None on timeout."""
+        fd = sys.stdin.fileno()
+        ch = _read_char(fd, timeout)
+        if ch is None:
+            return None
+
+        if ch == "\x1b":
+            # Escape sequences arrive in one burst; a lone ESC does not
+            seq = ""
+            while True:
+                nxt = _read_char(fd, 0.02)
+                if nxt is None:
+                    break
+                seq += nxt
+                if seq in _ESCAPE_KEYS or (len(seq) > 1 and seq[-1].isalpha() or seq.endswith("~")):
+                    break
+            if not seq:
+                return "escape"
+            return _ESCAPE_KEYS.get(seq)
+        if ch in ("\r", "\n"):
+            return "enter"
+        if ch in ("\x7f", "\x08"):
+            return "backspace"
+        if ch == "\t":
+            return "tab"
+        return ch
+
+
+def is_interactive() -> bool:
+    """Whether both stdin and stdout are attached to a terminal."""
+    return sys.stdin.isatty() and sys.stdout.isatty()
@@ -0,0 +1,81 @@
+# flavor/urlcheck.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from flavor import store
+
+# How long a probe result is trusted before the URL is checked again
+OK_TTL_SECONDS = 24 * 60 * 60
+BROKEN_TTL_SECONDS = 10 * 60
+TIMEOUT_SECONDS = 5
+MAX_WORKERS = 8
+
+# Servers that don't implement HEAD properly answer with one of these
+_HEAD_UNSUPPORTED = {403, 405, 501}
+
+# A plain session (no API credentials) shared by all probes, so links on the
+# same host reuse connections
+_session = None
+_session_lock = threading.Lock()
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers["User-Agent"] = "FlavorLineTool link checker"
+        return _session
+
+def _probe(url: str) -> dict:
+    """HEAD the URL, falling back to a one-byte ranged GET if HEAD isn't supported."""
+    session = _get_session()
+    try:
+        response = session.head(url, allow_redirects=True, timeout=TIMEOUT_SECONDS)
+        if response.status_code in _HEAD_UNSUPPORTED:
+            response = session.get(
+                url, headers={"Range": "bytes=0-0"}, allow_redirects=True,
+                stream=True, timeout=TIMEOUT_SECONDS,
+            )
+            response.close()
+    except requests.RequestException as e:
+        return {"ok": False, "status": None, "error": e.__class__.__name__}
+
+    return {"ok": response.status_code < 400, "status": response.status_code, "error": None}
+
+def _cached(url: str):
+    entry = store.load(f"urlcheck:{url}")
+    if entry is None:
+        return None
+    checked_at, result = entry
+    ttl = OK_TTL_SECONDS if result.get("ok") else BROKEN_TTL_SECONDS
+    if time.time() - checked_at > ttl:
+        return None
+    return result
+
+def _check(url: str) -> dict:
+    result = _cached(url)
+    if result is not None:
+        return result
+    result = _probe(url)
+    try:
+        store.save(f"urlcheck:{url}", result)
+    except OSError:
+        pass
+    return result
+
+def check_urls(urls) -> dict:
+    """
+    Check many URLs at once, returns {url: {"ok", "status", "error"}}.
+    Duplicate URLs are only probed once and recent results come from the cache.
+    """
+    unique = list(dict.fromkeys(url for url in urls if url))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(unique))) as pool:
+        return dict(zip(unique, pool.map(_check, unique)))
+
+def describe(result: dict) -> str:
+    if result["status"] is not None:
+        return f"{'OK' if result['ok'] else 'Broken'} ({result['status']})"
+    return f"Unreachable ({result['error']})"
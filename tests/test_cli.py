@@ -0,0 +1,16 @@
+import pytest
+import typer
+
+from flavor.cli import _parse_people
+
+def test_parse_people(tmp_path):
+    users_file = tmp_path / "team.txt"
+    users_file.write_text("# team\n4 dave\n5:erin  # lead\n\n")
+    assert _parse_people("1:alice, 2,:carol", users_file) == [
+        (1, "alice"), (2, None), (None, "carol"), (4, "dave"), (5, "erin"),
+    ]
+
+@pytest.mark.parametrize("users", [":", "1:a, : ", "x:alice"])
+def test_parse_people_rejects_bad_entries(users):
+    with pytest.raises(typer.BadParameter):
+        _parse_people(users, None)
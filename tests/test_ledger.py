@@ -0,0 +1,103 @@
+import threading
+from datetime import date, datetime
+
+import pytest
+
+from flavor import ledger
+
+TODAY = date(2026, 3, 10)
+
+def at(day: int, hour: int = 12) -> float:
+    return datetime(2026, 3, day, hour).timestamp()
+
+@pytest.fixture(autouse=True)
+def ledger_file(tmp_path, monkeypatch):
+    path = tmp_path / "cookies.ledger"
+    monkeypatch.setattr(ledger, "LEDGER_FILE", path)
+    return path
+
+def test_history_without_records_is_none():
+    assert ledger.history(1, days=7, today=TODAY) is None
+
+def test_duplicate_balance_within_window_is_skipped():
+    assert ledger.record_balance(1, 100, timestamp=at(1))
+    assert not ledger.record_balance(1, 100, timestamp=at(1) + 60)
+    assert ledger.record_balance(1, 100, timestamp=at(1) + ledger.DUPLICATE_WINDOW_SECONDS)
+    assert ledger.record_balance(2, 100, timestamp=at(1) + 60)
+
+def test_first_index_at_finds_first_record_at_or_after():
+    for cookies, day in enumerate((1, 3, 3, 5)):
+        ledger.record_balance(1, cookies, timestamp=at(day))
+    with ledger._open_ledger() as view:
+        assert view.count == 4
+        assert view.first_index_at(at(1) - 1) == 0
+        assert view.first_index_at(at(3)) == 1
+        assert view.first_index_at(at(4)) == 3
+        assert view.first_index_at(at(6)) == 4
+
+def test_history_daily_aggregation():
+    # Before the window, only used as the starting balance
+    ledger.record_balance(1, 50, timestamp=at(1))
+    ledger.record_balance(1, 80, timestamp=at(8, 9))
+    ledger.record_balance(1, 70, timestamp=at(8, 18))
+    ledger.record_balance(1, 100, timestamp=at(8, 20))
+    # Another user's records are ignored
+    ledger.record_balance(2, 999, timestamp=at(9))
+    ledger.record_balance(1, 130, timestamp=at(10))
+
+    summary = ledger.history(1, days=3, today=TODAY)
+
+    assert summary["first_seen"] == at(1)
+    assert summary["last_seen"] == at(10)
+    assert summary["balance"] == 130
+    assert summary["all_time_change"] == 80
+    assert summary["window_samples"] == 4
+    # Only increases count as earned: 50 -> 80, 70 -> 100 and 100 -> 130
+    assert summary["window_earned"] == 90
+    assert summary["daily"] == [
+        {"day": date(2026, 3, 8), "balance": 100, "change": 50, "earned": 60},
+        {"day": date(2026, 3, 9), "balance": 100, "change": 0, "earned": 0},
+        {"day": date(2026, 3, 10), "balance": 130, "change": 30, "earned": 30},
+    ]
+
+def test_history_before_first_record_has_no_balance():
+    ledger.record_balance(1, 10, timestamp=at(9))
+    daily = ledger.history(1, days=3, today=TODAY)["daily"]
+    assert daily[0] == {"day": date(2026, 3, 8), "balance": None, "change": None, "earned": 0}
+    assert daily[1]["balance"] == 10
+    assert daily[2] == {"day": date(2026, 3, 10), "balance": 10, "change": 0, "earned": 0}
+
+def test_partial_record_is_dropped_on_next_write(ledger_file):
+    ledger.record_balance(1, 10, timestamp=at(1))
+    with open(ledger_file, "ab") as f:
+        f.write(b"\x00" * 5)
+    ledger.record_balance(1, 20, timestamp=at(2))
+
+    assert ledger_file.stat().st_size == len(ledger.MAGIC) + 2 * ledger.RECORD.size
+    assert ledger.history(1, days=1, today=date(2026, 3, 2))["balance"] == 20
+
+def test_bad_file_raises(ledger_file):
+    ledger_file.write_bytes(b"NOTALEDGER" + b"\x00" * 40)
+    with pytest.raises(ledger.LedgerError):
+        ledger.history(1, today=TODAY)
+
+def test_concurrent_appends_keep_records_aligned(ledger_file):
+    threads, per_thread = 8, 25
+    barrier = threading.Barrier(threads)
+
+    def record(user_id):
+        barrier.wait()
+        for n in range(per_thread):
+            assert ledger.record_balance(user_id, n, timestamp=at(1) + n)
+
+    workers = [threading.Thread(target=record, args=(user_id,)) for user_id in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert ledger_file.read_bytes()[:len(ledger.MAGIC)] == ledger.MAGIC
+    assert ledger_file.stat().st_size == len(ledger.MAGIC) + threads * per_thread * ledger.RECORD.size
+    with ledger._open_ledger() as view:
+        for user_id in range(threads):
+            assert [r[2] for r in view.records() if r[1] == user_id] == list(range(per_thread))
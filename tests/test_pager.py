@@ -0,0 +1,33 @@
+import pytest
+
+from flavor.pager import Pager
+
+COLUMNS = [("ID", {})]
+
+def pager(fetch):
+    return Pager("Test", COLUMNS, fetch, lambda item: (str(item),))
+
+@pytest.mark.parametrize("totals", [(0, 0), (None, None), (1, 0)])
+def test_load_with_no_results(totals):
+    view = pager(lambda page: ([], *totals))
+    view.load(1)
+    assert view.cursor == 0
+    assert view._count() == 0
+    # Rendering an empty listing must not fail either
+    view._render()
+
+def test_load_starting_on_short_last_page():
+    items = list(range(23))
+    calls = []
+
+    def fetch(page):
+        calls.append(page)
+        return items[(page - 1) * 10:page * 10], 3, None
+
+    view = pager(fetch)
+    view.load(3)
+    assert calls == [3, 1]
+    assert view.page_size == 10
+    assert view.cursor == 20
+    assert view._count() == 23
+    assert view._item(21) == 21
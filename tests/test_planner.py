@@ -0,0 +1,115 @@
+import itertools
+import random
+import time
+
+import pytest
+
+from flavor import planner
+from flavor.commands.shop import _choices
+from flavor.planner import Choice, plan
+
+def brute_force(choices, budget):
+    """Best total value over every quantity combination."""
+    best = 0
+    for quantities in itertools.product(*(range(c.limit + 1) for c in choices)):
+        cost = sum(c.cost * q for c, q in zip(choices, quantities))
+        if cost <= budget:
+            best = max(best, sum(c.value * q for c, q in zip(choices, quantities)))
+    return best
+
+def random_choices(rng, count):
+    return [Choice(i, rng.randint(1, 40), rng.randint(1, 10), rng.randint(0, 3)) for i in range(count)]
+
+def check(result, choices, budget):
+    by_key = {c.key: c for c in choices}
+    for key, quantity in result["quantities"].items():
+        assert 0 < quantity <= by_key[key].limit
+    assert result["cost"] == sum(by_key[k].cost * q for k, q in result["quantities"].items())
+    assert result["cost"] <= budget
+    assert result["value"] == pytest.approx(brute_force(choices, budget))
+
+def test_matches_brute_force():
+    rng = random.Random(1)
+    for _ in range(50):
+        choices = random_choices(rng, 5)
+        budget = rng.randint(0, 120)
+        result = plan(choices, budget)
+        assert result["method"] in ("dp", "greedy")
+        assert result["optimal"]
+        check(result, choices, budget)
+
+def test_branch_and_bound_fallback_matches_brute_force(monkeypatch):
+    monkeypatch.setattr(planner, "MAX_DP_CELLS", 0)
+    rng = random.Random(2)
+    for _ in range(50):
+        choices = random_choices(rng, 5)
+        budget = rng.randint(1, 120)
+        result = plan(choices, budget)
+        if result["quantities"]:
+            assert result["method"] in ("branch and bound", "greedy")
+        assert result["optimal"]
+        check(result, choices, budget)
+
+def test_equal_values_match_brute_force():
+    rng = random.Random(3)
+    for _ in range(50):
+        choices = [Choice(i, rng.randint(1, 40), 2, rng.randint(1, 3)) for i in range(5)]
+        budget = rng.randint(0, 120)
+        result = plan(choices, budget)
+        check(result, choices, budget)
+        if result["quantities"]:
+            assert result["method"] == "greedy"
+        # Of the baskets with the most items, the cheapest
+        cheapest = sorted(c.cost for c in choices for _ in range(c.limit))
+        assert result["cost"] == sum(cheapest[:int(result["value"] // 2)])
+
+def test_default_goal_on_a_large_shop_is_instant():
+    rng = random.Random(4)
+    choices = [Choice(i, rng.randint(100, 5000), 1, 1) for i in range(120)]
+    started = time.monotonic()
+    result = plan(choices, 100_000)
+    assert time.monotonic() - started < 0.5
+    assert result["optimal"]
+    costs = sorted(c.cost for c in choices)
+    count = max(n for n in range(len(costs) + 1) if sum(costs[:n]) <= 100_000)
+    assert result["value"] == count
+    assert result["cost"] == sum(costs[:count])
+
+def test_respects_limits():
+    # Without the limit, 10 copies of the cheap item would be best
+    choices = [Choice("cheap", 1, 1, 2), Choice("dear", 4, 2, 5)]
+    result = plan(choices, 10)
+    assert result["quantities"] == {"cheap": 2, "dear": 2}
+    assert result["value"] == 6
+
+def test_shared_cost_factor():
+    choices = [Choice("a", 500, 4, 1), Choice("b", 300, 2, 2), Choice("c", 200, 1, 3)]
+    result = plan(choices, 1000)
+    check(result, choices, 1000)
+    assert result["quantities"] == {"a": 1, "b": 1, "c": 1}
+
+def test_free_items_are_taken_in_full():
+    result = plan([Choice("free", 0, 1, 3), Choice("paid", 4, 1, 1)], 3)
+    assert result["quantities"] == {"free": 3}
+    assert result["cost"] == 0
+
+def test_nothing_affordable():
+    result = plan([Choice("a", 10, 1, 1), Choice("b", 5, 0, 1)], 9)
+    assert result["quantities"] == {}
+    assert result["cost"] == 0
+    assert result["optimal"]
+
+def test_stock_and_limited_items():
+    items = [
+        {"id": 1, "ticket_cost": {"base_cost": 2}, "limited": True},
+        {"id": 2, "ticket_cost": {"base_cost": 3}, "stock": 1},
+        {"id": 3, "ticket_cost": {"base_cost": 1}, "stock": 0},
+        {"id": 4, "ticket_cost": {"base_cost": 4}},
+        {"id": 5, "ticket_cost": {}},
+    ]
+    choices = _choices(items, "items", {}, max_each=5)
+    assert [(c.key, c.limit) for c in choices] == [(1, 1), (2, 1), (3, 0), (4, 5)]
+
+    result = plan(choices, 20)
+    assert result["quantities"] == {1: 1, 2: 1, 4: 3}
+    assert result["cost"] == 17
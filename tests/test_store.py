@@ -0,0 +1,64 @@
+import io
+import json
+import threading
+
+import pytest
+
+from flavor import store
+
+class FakeError(Exception):
+    pass
+
+@pytest.fixture(autouse=True)
+def empty_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "STORE_FILE", tmp_path / "store.db")
+    monkeypatch.setattr(store, "_local", threading.local())
+    monkeypatch.setattr(store, "_served_stale", [])
+    monkeypatch.setattr(store, "_revalidating", {})
+
+def make_stale():
+    conn = store._connect()
+    with conn:
+        conn.execute("UPDATE entries SET stored_at = stored_at - ?", (store.FRESH_SECONDS + 1,))
+
+def test_stale_entries_are_refreshed_by_one_worker(monkeypatch):
+    registered, workers = [], []
+
+    class FakePopen:
+        def __init__(self, args, **kwargs):
+            self.args = args
+            self.stdin = io.BytesIO()
+            self.stdin.close = lambda: None
+            workers.append(self)
+
+    monkeypatch.setattr(store.atexit, "register", registered.append)
+    monkeypatch.setattr(store.subprocess, "Popen", FakePopen)
+
+    fetched = []
+
+    @store.cached(FakeError)
+    def get_thing(thing_id: int):
+        fetched.append(thing_id)
+        return {"id": thing_id}
+
+    for thing_id in range(40):
+        get_thing(thing_id)
+    make_stale()
+    for thing_id in list(range(40)) * 2:
+        assert get_thing(thing_id) == {"id": thing_id}
+
+    # Served from the store, nothing is fetched or started until exit
+    assert len(fetched) == 40
+    assert workers == []
+    assert registered == [store._start_revalidation]
+
+    store._start_revalidation()
+    assert len(workers) == 1
+    assert workers[0].args[-1] == "--revalidate"
+    calls = json.loads(workers[0].stdin.getvalue())
+    assert sorted(json.loads(arguments)["thing_id"] for _, _, _, arguments in calls) == list(range(40))
+    assert {(module, name) for _, module, name, _ in calls} == {(__name__, "get_thing")}
+
+def test_nothing_stale_starts_no_worker(monkeypatch):
+    monkeypatch.setattr(store.subprocess, "Popen", lambda *args, **kwargs: pytest.fail("worker started"))
+    store._start_revalidation()